@@ -1,8 +1,10 @@
 """API routes for gas pressurization simulation."""
 
 import json
-from collections.abc import AsyncGenerator
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Generator, Iterable
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pint_glass import TARGET_DIMENSIONS, UNIT_SYSTEMS
@@ -16,12 +18,32 @@ from pressurize.api.schemas import (
     StreamingComplete,
 )
 from pressurize.core.properties import GasState, get_gas_properties_at_conditions
-from pressurize.core.simulation import run_simulation_streaming
+from pressurize.core.simulation import FLOW_REGIMES, run_simulation_streaming
 from pressurize.utils import ATM_PA, absolute_pressure
 
 router = APIRouter(tags=["pressurize"])
 
 CHUNK_SIZE = 5  # Number of rows per streaming chunk
+SIMULATION_CACHE_SIZE = 64  # Completed simulations kept for repeated requests
+
+# Numeric row fields kept by the cache; "pressure" repeats downstream_pressure
+_CACHED_ROW_FIELDS = (
+    "time",
+    "upstream_pressure",
+    "downstream_pressure",
+    "flowrate",
+    "valve_opening_pct",
+    "dp_dt_upstream",
+    "dp_dt_downstream",
+    "z_factor",
+    "k_ratio",
+    "molar_mass",
+)
+_REGIME_CODES = {name: code for code, name in enumerate(FLOW_REGIMES)}
+
+# Completed simulations keyed by the SI request, least recently used first, as
+# (row values in _CACHED_ROW_FIELDS order, flow regime codes)
+_SIMULATION_CACHE: OrderedDict[str, tuple[np.ndarray, np.ndarray]] = OrderedDict()
 
 # Cache the unit configuration at startup
 _CACHED_UNITS_CONFIG = {
@@ -29,6 +51,50 @@ _CACHED_UNITS_CONFIG = {
     "dimensions": {dim.lower(): systems for dim, systems in TARGET_DIMENSIONS.items()},
 }
 
+# Static composition editor data, built once at startup
+_CACHED_COMPONENTS = GasState.get_default_components()
+_CACHED_PRESETS = [
+    {"id": "natural_gas", "name": "Natural Gas (Pipeline)"},
+    {"id": "pure_methane", "name": "Pure Methane"},
+    {"id": "rich_gas", "name": "Rich Gas"},
+    {"id": "sour_gas", "name": "Sour Gas"},
+    {"id": "lean_gas", "name": "Lean Gas"},
+]
+
+
+def _pack_rows(rows: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack result rows into a float64 value array and int8 flow regime codes."""
+    values = np.array([[r[f] for f in _CACHED_ROW_FIELDS] for r in rows])
+    codes = np.fromiter(
+        (_REGIME_CODES[r["flow_regime"]] for r in rows), dtype=np.int8, count=len(rows)
+    )
+    return values, codes
+
+
+def _unpack_rows(values: np.ndarray, codes: np.ndarray) -> Generator[dict, None, None]:
+    """Rebuild the result rows packed by _pack_rows."""
+    for row, code in zip(values.tolist(), codes.tolist(), strict=True):
+        row_dict = dict(zip(_CACHED_ROW_FIELDS, row, strict=True))
+        row_dict["pressure"] = row_dict["downstream_pressure"]
+        row_dict["flow_regime"] = FLOW_REGIMES[code]
+        yield row_dict
+
+
+def _replay_cached(key: str) -> Generator[dict, None, None] | None:
+    """Return the rows of a cached simulation, or None on a cache miss."""
+    entry = _SIMULATION_CACHE.get(key)
+    if entry is None:
+        return None
+    _SIMULATION_CACHE.move_to_end(key)
+    return _unpack_rows(*entry)
+
+
+def _store_cached(key: str, rows: list[dict]) -> None:
+    """Cache the rows of a completed simulation, evicting the oldest entry."""
+    _SIMULATION_CACHE[key] = _pack_rows(rows)
+    if len(_SIMULATION_CACHE) > SIMULATION_CACHE_SIZE:
+        _SIMULATION_CACHE.popitem(last=False)
+
 
 @router.get("/units/config")
 async def get_units_config() -> dict:
@@ -69,47 +135,51 @@ async def generate_simulation_stream(
             nonlocal client_disconnected
             return client_disconnected
 
-        # Use the streaming generator
+        # Replay identical requests from the cache, otherwise run the simulation
         all_results = []
         total_rows = 0
 
-        for row_dict in run_simulation_streaming(
-            P_up=absolute_pressure(req.p_up),
-            P_down_init=absolute_pressure(req.p_down_init),
-            valve_id=req.valve_id / 1000,  # Convert mm to m for physics engine
-            opening_time=req.opening_time,
-            upstream_volume=req.upstream_volume,
-            upstream_temp=req.upstream_temp,
-            downstream_volume=req.downstream_volume,
-            downstream_temp=req.downstream_temp,
-            molar_mass=req.molar_mass,
-            z_factor=req.z_factor,
-            k_ratio=req.k_ratio,
-            discharge_coeff=req.discharge_coeff,
-            valve_action=req.valve_action,
-            opening_mode=req.opening_mode,
-            k_curve=req.k_curve,
-            dt=req.dt,
-            property_mode=req.property_mode,
-            composition=req.composition,
-            mode=req.mode,
-            should_stop_callback=should_stop,
-        ):
+        cache_key = req.model_dump_json()
+        cached_rows = _replay_cached(cache_key)
+        rows: Iterable[dict]
+        if cached_rows is not None:
+            logger.info("♻️ Replaying cached simulation results")
+            rows = cached_rows
+        else:
+            rows = run_simulation_streaming(
+                P_up=absolute_pressure(req.p_up),
+                P_down_init=absolute_pressure(req.p_down_init),
+                valve_id=req.valve_id / 1000,  # Convert mm to m for physics engine
+                opening_time=req.opening_time,
+                upstream_volume=req.upstream_volume,
+                upstream_temp=req.upstream_temp,
+                downstream_volume=req.downstream_volume,
+                downstream_temp=req.downstream_temp,
+                molar_mass=req.molar_mass,
+                z_factor=req.z_factor,
+                k_ratio=req.k_ratio,
+                discharge_coeff=req.discharge_coeff,
+                valve_action=req.valve_action,
+                opening_mode=req.opening_mode,
+                k_curve=req.k_curve,
+                dt=req.dt,
+                property_mode=req.property_mode,
+                composition=req.composition,
+                mode=req.mode,
+                should_stop_callback=should_stop,
+                pressure_offset=ATM_PA,  # Stream gauge pressures to the frontend
+            )
+
+        for row_dict in rows:
             # Store all results for KPI calculation
             all_results.append(row_dict)
             total_rows += 1
 
             # Stream in chunks of CHUNK_SIZE
             if len(all_results) % CHUNK_SIZE == 0:
-                # Convert results back to gauge for frontend
-                rows_to_send = []
-                for r in all_results[-CHUNK_SIZE:]:
-                    # Create a copy so we don't mutate the original result used for KPIs
-                    r_gauge = r.copy()
-                    r_gauge["pressure"] -= ATM_PA
-                    r_gauge["upstream_pressure"] -= ATM_PA
-                    r_gauge["downstream_pressure"] -= ATM_PA
-                    rows_to_send.append(SimulationResultPoint(**r_gauge))
+                rows_to_send = [
+                    SimulationResultPoint(**r) for r in all_results[-CHUNK_SIZE:]
+                ]
 
                 chunk = StreamingChunk(
                     rows=rows_to_send,
@@ -125,13 +195,9 @@ async def generate_simulation_stream(
         # Send any remaining rows
         remaining = len(all_results) % CHUNK_SIZE
         if remaining > 0:
-            rows_to_send = []
-            for r in all_results[-remaining:]:
-                r_gauge = r.copy()
-                r_gauge["pressure"] -= ATM_PA
-                r_gauge["upstream_pressure"] -= ATM_PA
-                r_gauge["downstream_pressure"] -= ATM_PA
-                rows_to_send.append(SimulationResultPoint(**r_gauge))
+            rows_to_send = [
+                SimulationResultPoint(**r) for r in all_results[-remaining:]
+            ]
 
             chunk = StreamingChunk(
                 rows=rows_to_send,
@@ -141,7 +207,7 @@ async def generate_simulation_stream(
 
         # Calculate KPIs from collected results
         if all_results:
-            # Extract flowrates and pressures (SI units)
+            # Extract flowrates and pressures (SI units, gauge pressures)
             flowrates = [r["flowrate"] for r in all_results]
             downstream_pressures = [r["downstream_pressure"] for r in all_results]
             upstream_pressures = [r["upstream_pressure"] for r in all_results]
@@ -165,6 +231,9 @@ async def generate_simulation_stream(
 
             # Determine if simulation completed naturally or was aborted
             completed = not should_stop()
+
+            if completed and cached_rows is None:
+                _store_cached(cache_key, all_results)
         else:
             peak_flow = 0.0
             final_pressure = req.p_down_init
@@ -175,7 +244,7 @@ async def generate_simulation_stream(
         # Log base output (SI units before conversion)
         base_output = {
             "peak_flow_kg_s": peak_flow,
-            "final_pressure_pa": final_pressure,
+            "final_pressure_pa": absolute_pressure(final_pressure),
             "equilibrium_time_s": equil_time,
             "total_mass_kg": total_mass,
             "total_rows": total_rows,
@@ -184,10 +253,10 @@ async def generate_simulation_stream(
         logger.info("🔧 BASE OUTPUT (SI units - before PintGlass conversion):")
         logger.info(json.dumps(base_output, indent=2))
 
-        # Send completion message with KPIs (converted back to gauge)
+        # Send completion message with KPIs (pressures already gauge)
         complete = StreamingComplete(
             peak_flow=peak_flow,
-            final_pressure=final_pressure - ATM_PA,
+            final_pressure=final_pressure,
             equilibrium_time=equil_time,
             total_mass=total_mass,
             completed=completed,
@@ -232,22 +301,24 @@ async def stream_simulation_endpoint(
     )
 
 
+@router.delete("/simulate/cache")
+async def clear_simulation_cache() -> dict[str, int]:
+    """Drop all cached simulation results."""
+    cleared = len(_SIMULATION_CACHE)
+    _SIMULATION_CACHE.clear()
+    return {"cleared": cleared}
+
+
 @router.get("/components")
 async def get_components() -> list[str]:
     """Get list of available gas components for composition modeling."""
-    return GasState.get_default_components()
+    return _CACHED_COMPONENTS
 
 
 @router.get("/presets")
 async def get_presets() -> list[dict[str, str]]:
     """Get list of predefined gas composition presets."""
-    return [
-        {"id": "natural_gas", "name": "Natural Gas (Pipeline)"},
-        {"id": "pure_methane", "name": "Pure Methane"},
-        {"id": "rich_gas", "name": "Rich Gas"},
-        {"id": "sour_gas", "name": "Sour Gas"},
-        {"id": "lean_gas", "name": "Lean Gas"},
-    ]
+    return _CACHED_PRESETS
 
 
 @router.get("/presets/{preset_id}")
@@ -11,4 +11,6 @@ TIME_STEP: Final[float] = 0.5  # Time step for simulation (seconds)
 MAX_SIMULATION_TIME_FIXED: Final[float] = (
     10000  # Max simulation time for fixed opening mode (seconds)
 )
-
+PROPERTY_UPDATE_STRIDE: Final[int] = (
+    10  # Steps between gas property updates in composition mode
+)
@@ -0,0 +1,35 @@
+"""Optional Numba JIT compilation for the simulation kernels.
+
+Numba is an optional dependency (``pip install pressurize[jit]``). When it is not
+installed, ``njit`` returns the decorated function unchanged, ``prange`` is the
+builtin ``range`` and the kernels run as plain Python with identical results.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+except ImportError:  # pragma: no cover - exercised when numba is not installed
+    _numba_njit = None
+    prange = range
+
+NUMBA_AVAILABLE = _numba_njit is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile a function with ``numba.njit`` if Numba is installed.
+
+    Supports both the bare ``@njit`` and the ``@njit(cache=True)`` forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable) -> Callable:
+        return func
+
+    return decorator
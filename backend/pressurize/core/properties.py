@@ -1,11 +1,21 @@
 """Gas property calculations using the thermo library."""
 
+import re
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 
+import numpy as np
 from thermo import (  # type: ignore[import-untyped]
     PRMIX,
     CEOSGas,
     ChemicalConstantsPackage,
+    PropertyCorrelationsPackage,
+)
+
+# One "Component=fraction" pair; names may contain spaces ("Carbon dioxide")
+_COMPOSITION_PAIR_RE = re.compile(
+    r"\s*([^,=]+?)\s*=\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)\s*"
 )
 
 # Top 20 components for natural gas and industrial applications
@@ -32,8 +42,64 @@ DEFAULT_COMPONENTS = [
     "Ammonia",  # NH3
 ]
 
-
-@dataclass
+# Preset compositions offered by the API and the composition editor
+_PRESETS: dict[str, dict[str, float]] = {
+    "natural_gas": {
+        "Methane": 0.9387,
+        "Ethane": 0.0121,
+        "Propane": 0.0004,
+        "n-Butane": 0.0,
+        "n-Pentane": 0.0,
+        "Carbon dioxide": 0.0054,
+        "Hydrogen sulfide": 0.0,
+        "Water": 0.0,
+        "Nitrogen": 0.0433,
+    },
+    "pure_methane": {
+        "Methane": 1.0,
+    },
+    "rich_gas": {
+        "Methane": 0.75,
+        "Ethane": 0.12,
+        "Propane": 0.08,
+        "n-Butane": 0.03,
+        "n-Pentane": 0.01,
+        "Carbon dioxide": 0.005,
+        "Nitrogen": 0.005,
+    },
+    "sour_gas": {
+        "Methane": 0.85,
+        "Ethane": 0.05,
+        "Propane": 0.02,
+        "n-Butane": 0.01,
+        "Carbon dioxide": 0.08,
+        "Hydrogen sulfide": 0.04,
+    },
+    "lean_gas": {
+        "Methane": 0.96,
+        "Ethane": 0.02,
+        "Propane": 0.005,
+        "Carbon dioxide": 0.005,
+        "Nitrogen": 0.01,
+    },
+}
+
+# Composition strings for each preset, omitting zero fractions
+_PRESET_STRINGS = {
+    name: ", ".join(f"{comp}={val:.4f}" for comp, val in preset.items() if val > 0)
+    for name, preset in _PRESETS.items()
+}
+
+
+@lru_cache(maxsize=32)
+def _load_constants(
+    components: tuple[str, ...],
+) -> tuple[ChemicalConstantsPackage, PropertyCorrelationsPackage]:
+    """Load thermo constants and correlations, cached per ordered component tuple."""
+    return ChemicalConstantsPackage.from_IDs(list(components))
+
+
+@dataclass(slots=True, frozen=True)
 class GasProperties:
     """Container for calculated gas properties."""
 
@@ -51,60 +117,85 @@ class GasState:
     Uses the Peng-Robinson equation of state for real gas behavior.
     """
 
-    def __init__(self, composition: str):
-        """Initialize GasState with a composition string.
+    def __init__(self, composition: str | Mapping[str, float]):
+        """Initialize GasState with a composition string or mapping.
 
         Args:
-            composition: Comma-separated "Component=fraction" pairs.
+            composition: Comma-separated "Component=fraction" pairs, or a
+                mapping of component name to fraction.
                 Example: "Methane=0.9, Ethane=0.1"
         """
-        self.components, self.molar_fraction = self._parse_composition(composition)
+        if isinstance(composition, Mapping):
+            self.components, self.molar_fraction = self._normalize_fractions(
+                list(composition), np.fromiter(composition.values(), np.float64)
+            )
+        else:
+            self.components, self.molar_fraction = self._parse_composition(composition)
         self._setup_thermo()
 
+    @classmethod
+    def from_dict(cls, composition: Mapping[str, float]) -> "GasState":
+        """Create a GasState from a component-to-fraction mapping.
+
+        Skips formatting the mapping into a composition string and parsing it
+        back. Fractions are filtered and normalized as for strings.
+        """
+        return cls(composition)
+
     def _parse_composition(self, composition: str) -> tuple[list[str], list[float]]:
         """Parse composition string into component names and mole fractions."""
-        components = []
-        fractions = []
-
         if not composition or not composition.strip():
             # Default to pure methane if no composition provided
             return ["Methane"], [1.0]
 
-        pairs = composition.split(",")
-        for pair in pairs:
-            pair = pair.strip()
-            if "=" in pair:
-                name, value = pair.split("=", 1)
-                name = name.strip()
-                try:
-                    fraction = float(value.strip())
-                    if fraction > 0:
-                        components.append(name)
-                        fractions.append(fraction)
-                except ValueError:
-                    continue
-
-        if not components:
+        # Pairs that are not a single "name=number" are skipped
+        matches = [
+            m
+            for m in map(_COMPOSITION_PAIR_RE.fullmatch, composition.split(","))
+            if m is not None
+        ]
+        fractions = np.fromiter((float(m[2]) for m in matches), dtype=np.float64)
+        return self._normalize_fractions([m[1] for m in matches], fractions)
+
+    @staticmethod
+    def _normalize_fractions(
+        names: list[str], fractions: np.ndarray
+    ) -> tuple[list[str], list[float]]:
+        """Drop non-positive fractions and normalize the rest to sum to 1.0."""
+        keep = fractions > 0
+        if not keep.any():
             # Default to pure methane if parsing fails
             return ["Methane"], [1.0]
 
+        components = [n for n, k in zip(names, keep, strict=True) if k]
+        fractions = fractions[keep]
+
         # Normalize fractions to sum to 1.0
-        total = sum(fractions)
-        if total > 0:
-            fractions = [f / total for f in fractions]
+        fractions /= fractions.sum()
 
-        return components, fractions
+        return components, fractions.tolist()
 
     def _setup_thermo(self) -> None:
         """Initialize the thermodynamic property package."""
-        self.constants, self.correlations = ChemicalConstantsPackage.from_IDs(
-            self.components
-        )
+        self.constants, self.correlations = _load_constants(tuple(self.components))
 
         # Calculate mixture molar mass
-        self.molar_mass = sum(
-            z * mw
-            for z, mw in zip(self.molar_fraction, self.constants.MWs, strict=True)
+        zs = np.asarray(self.molar_fraction, dtype=np.float64)
+        MWs = np.asarray(self.constants.MWs, dtype=np.float64)
+        self.molar_mass = float(np.dot(zs, MWs))
+        self._molar_mass_kg = self.molar_mass / 1000
+
+        # Peng-Robinson gas phase, re-evaluated at each state with to_TP_zs
+        eos_kwargs = dict(
+            Tcs=self.constants.Tcs, Pcs=self.constants.Pcs, omegas=self.constants.omegas
+        )
+        self._base_gas = CEOSGas(
+            PRMIX,
+            eos_kwargs,
+            HeatCapacityGases=self.correlations.HeatCapacityGases,
+            T=298.15,
+            P=101325.0,
+            zs=self.molar_fraction,
         )
 
     def get_properties(self, pressure: float, temperature: float) -> GasProperties:
@@ -117,21 +208,37 @@ class GasState:
         Returns:
             GasProperties with Z, k, M, rho, Cp, Cv.
         """
-        # Create Peng-Robinson gas phase
-        eos_kwargs = dict(
-            Tcs=self.constants.Tcs, Pcs=self.constants.Pcs, omegas=self.constants.omegas
-        )
+        gas = self._base_gas.to_TP_zs(temperature, pressure, self.molar_fraction)
+        return self._phase_properties(gas, pressure, temperature)
 
-        gas = CEOSGas(
-            PRMIX,
-            eos_kwargs,
-            HeatCapacityGases=self.correlations.HeatCapacityGases,
-            T=temperature,
-            P=pressure,
-            zs=self.molar_fraction,
-        )
+    def get_properties_batch(
+        self, pressures: Sequence[float], temperature: float
+    ) -> list[GasProperties]:
+        """Calculate gas properties at several pressures and one temperature.
+
+        Each phase is derived from the previous one at the same temperature,
+        so the temperature-dependent EOS attractive terms are computed once
+        rather than once per pressure.
+
+        Args:
+            pressures: Pressures in Pascals.
+            temperature: Temperature in Kelvin.
 
-        # Extract properties
+        Returns:
+            List of GasProperties in the same order as ``pressures``.
+        """
+        results = []
+        gas = self._base_gas
+        for pressure in pressures:
+            pressure = float(pressure)
+            gas = gas.to_TP_zs(temperature, pressure, self.molar_fraction)
+            results.append(self._phase_properties(gas, pressure, temperature))
+        return results
+
+    def _phase_properties(
+        self, gas: CEOSGas, pressure: float, temperature: float
+    ) -> GasProperties:
+        """Extract GasProperties from a thermo phase at (pressure, temperature)."""
         Z = gas.Z()
         Cp = gas.Cp()  # J/mol/K
         Cv = gas.Cv()  # J/mol/K
@@ -141,7 +248,7 @@ class GasState:
 
         # Density from ideal gas law with compressibility
         R = 8.314  # J/mol/K
-        rho = (pressure * self.molar_mass / 1000) / (Z * R * temperature)  # kg/m³
+        rho = (pressure * self._molar_mass_kg) / (Z * R * temperature)  # kg/m³
 
         return GasProperties(
             Z=Z,
@@ -152,6 +259,33 @@ class GasState:
             Cv=Cv,  # g/mol
         )
 
+    def build_property_table(
+        self, P_min: float, P_max: float, temperature: float, n: int = 64
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Tabulate gas properties over a pressure range at a fixed temperature.
+
+        Each entry needs a full equation-of-state evaluation, so callers that
+        query many pressures in a known range can build the table once and
+        interpolate with np.interp instead of calling get_properties repeatedly.
+
+        Args:
+            P_min: Lowest pressure in Pascals.
+            P_max: Highest pressure in Pascals.
+            temperature: Temperature in Kelvin.
+            n: Number of pressure points.
+
+        Returns:
+            Tuple of (pressures, Z, k, M) arrays of length n, with pressures in
+            increasing order.
+        """
+        pressures = np.linspace(P_min, P_max, n)
+        props = self.get_properties_batch(pressures, temperature)
+        Zs = np.array([p.Z for p in props])
+        ks = np.array([p.k for p in props])
+        Ms = np.array([p.M for p in props])
+
+        return pressures, Zs, ks, Ms
+
     @staticmethod
     def get_default_components() -> list[str]:
         """Return the list of default supported components."""
@@ -166,6 +300,19 @@ class GasState:
             "Hydrogen sulfide=0.00, Water=0.00, Nitrogen=0.0433"
         )
 
+    @classmethod
+    def from_preset(cls, preset_name: str) -> "GasState":
+        """Create a GasState from a named preset without parsing a string.
+
+        Unknown names fall back to 'natural_gas', as in get_preset_composition.
+        """
+        return cls.from_dict(_PRESETS.get(preset_name, _PRESETS["natural_gas"]))
+
+    @staticmethod
+    def get_preset_composition_string(preset_name: str) -> str:
+        """Get a preset as a "Component=fraction" composition string."""
+        return _PRESET_STRINGS.get(preset_name, _PRESET_STRINGS["natural_gas"])
+
     @staticmethod
     def get_preset_composition(preset_name: str) -> dict[str, float]:
         """Get a preset composition as a dictionary of component:fraction pairs.
@@ -176,48 +323,7 @@ class GasState:
         Returns:
             Dictionary mapping component names to mole fractions.
         """
-        presets = {
-            "natural_gas": {
-                "Methane": 0.9387,
-                "Ethane": 0.0121,
-                "Propane": 0.0004,
-                "n-Butane": 0.0,
-                "n-Pentane": 0.0,
-                "Carbon dioxide": 0.0054,
-                "Hydrogen sulfide": 0.0,
-                "Water": 0.0,
-                "Nitrogen": 0.0433,
-            },
-            "pure_methane": {
-                "Methane": 1.0,
-            },
-            "rich_gas": {
-                "Methane": 0.75,
-                "Ethane": 0.12,
-                "Propane": 0.08,
-                "n-Butane": 0.03,
-                "n-Pentane": 0.01,
-                "Carbon dioxide": 0.005,
-                "Nitrogen": 0.005,
-            },
-            "sour_gas": {
-                "Methane": 0.85,
-                "Ethane": 0.05,
-                "Propane": 0.02,
-                "n-Butane": 0.01,
-                "Carbon dioxide": 0.08,
-                "Hydrogen sulfide": 0.04,
-            },
-            "lean_gas": {
-                "Methane": 0.96,
-                "Ethane": 0.02,
-                "Propane": 0.005,
-                "Carbon dioxide": 0.005,
-                "Nitrogen": 0.01,
-            },
-        }
-
-        return presets.get(preset_name, presets["natural_gas"])
+        return dict(_PRESETS.get(preset_name, _PRESETS["natural_gas"]))
 
 
 def get_gas_properties_at_conditions(
@@ -1,20 +1,24 @@
 """Dynamic valve pressurization simulation engine."""
 
 import logging
-from collections.abc import Callable, Generator
+import multiprocessing
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
+import pandas as pd
 
 from pressurize.config.settings import (
     MAX_SIMULATION_TIME_FIXED,
+    PROPERTY_UPDATE_STRIDE,
     TIME_STEP,
 )
+from pressurize.core.jit import njit, prange
 from pressurize.core.physics import (
     calculate_critical_pressure_ratio,
-    calculate_dual_dp_dt,
-    calculate_mass_flow_rate,
+    calculate_valve_flow,
 )
 from pressurize.core.properties import GasState
 
@@ -28,6 +32,37 @@ EQUILIBRIUM_TOLERANCE_KGS = 1e-6
 # Batch size for yielding results (yield every N steps for performance)
 YIELD_BATCH_SIZE = 10
 
+# Relative pressure change that triggers an early gas property update
+PROPERTY_UPDATE_RTOL = 0.01
+
+# Adaptive time stepping (fixed opening mode only): the step doubles after
+# ADAPTIVE_QUIET_STEPS consecutive steps that change the pressure by less than
+# ADAPTIVE_DP_RTOL of the upstream pressure, up to ADAPTIVE_DT_MAX_FACTOR * dt.
+ADAPTIVE_DP_RTOL = 1e-4
+ADAPTIVE_QUIET_STEPS = 5
+ADAPTIVE_DT_MAX_FACTOR = 32
+
+# Flow regime codes produced by the step kernels, indexing FLOW_REGIMES
+FLOW_REGIMES = ("None", "Choked", "Subsonic", "Equilibrium")
+REGIME_CHOKED = 1
+REGIME_SUBSONIC = 2
+REGIME_EQUILIBRIUM = 3
+_REGIME_NAMES = np.array(FLOW_REGIMES)
+
+# Column order of the step buffer filled by _run_steps
+RESULT_COLUMNS = (
+    "time",
+    "upstream_pressure",
+    "downstream_pressure",
+    "flowrate",
+    "valve_opening_pct",
+    "dp_dt_upstream",
+    "dp_dt_downstream",
+    "z_factor",
+    "k_ratio",
+    "molar_mass",
+)
+
 
 @dataclass
 class SimulationState:
@@ -46,6 +81,7 @@ class SimulationState:
     k: float
     gas_state_up: GasState | None
     gas_state_down: GasState | None
+    property_table: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None = None
 
 
 def _initialize_simulation_state(
@@ -112,24 +148,33 @@ def _initialize_simulation_state(
     )
 
     # Initialize gas properties based on mode
+    property_table = None
     if property_mode == "composition" and composition:
         logger.debug(f"Using composition mode with composition: {composition}")
         if mode == "equalize":
             gas_state_up = GasState(composition)
             gas_state_down = GasState(composition)
-            props_up = gas_state_up.get_properties(P_up, T_up)
             props_down = gas_state_down.get_properties(P_down, T_down)
             M, Z, k = props_down.M, props_down.Z, props_down.k
+            gas_state, T_table = gas_state_down, T_down
         elif mode == "pressurize":
             gas_state_up = None
             gas_state_down = GasState(composition)
             props_down = gas_state_down.get_properties(P_down, T_down)
             M, Z, k = props_down.M, props_down.Z, props_down.k
+            gas_state, T_table = gas_state_down, T_down
         else:  # depressurize
             gas_state_up = GasState(composition)
             gas_state_down = None
             props_up = gas_state_up.get_properties(P_up, T_up)
             M, Z, k = props_up.M, props_up.Z, props_up.k
+            gas_state, T_table = gas_state_up, T_up
+
+        # Both pressures stay between their initial values for the whole run,
+        # so the equation of state is only evaluated on that range once.
+        property_table = gas_state.build_property_table(
+            min(P_up, P_down), max(P_up, P_down), T_table
+        )
     else:
         # Manual mode
         logger.debug(
@@ -156,99 +201,85 @@ def _initialize_simulation_state(
         k=k,
         gas_state_up=gas_state_up,
         gas_state_down=gas_state_down,
+        property_table=property_table,
     )
 
 
-def _initialize_results(
-    P_up: float,
-    P_down_init: float,
-    valve_action: Literal["open", "close"],
-    opening_mode: Literal["linear", "exponential", "quick_acting", "fixed"],
-    Z: float,
-    k: float,
-    M: float,
-) -> dict:
-    """Initialize results dictionary with initial state.
+def _linear_schedule(t: np.ndarray, opening_time: float, k_curve: float) -> np.ndarray:
+    """Linear valve travel."""
+    if opening_time <= 0:
+        return np.ones_like(t)
+    return np.minimum(t / opening_time, 1.0)
 
-    Args:
-        P_up: Initial upstream pressure (Pa).
-        P_down_init: Initial downstream pressure (Pa).
-        valve_action: "open" or "close".
-        opening_mode: Type of valve opening curve.
-        Z: Compressibility factor.
-        k: Heat capacity ratio.
-        M: Molar mass.
 
-    Returns:
-        Dictionary with initialized result lists.
-    """
-    # Determine initial valve opening percentage
-    if valve_action == "close":
-        initial_opening = 100.0
-    elif opening_mode == "fixed":
-        initial_opening = 100.0
-    else:
-        initial_opening = 0.0
-
-    return {
-        "time": [0],
-        "pressure": [P_down_init],
-        "upstream_pressure": [P_up],
-        "downstream_pressure": [P_down_init],
-        "flowrate": [
-            0
-        ],  # Stored as kg/s or converted to display unit? Using kg/s internally?
-        # Wait, SimulationResultPoint.flowrate is float.
-        # Previously flowrate_lb_hr. Let's store kg/s here and let frontend/API decide?
-        # But SimulationResultPoint just says 'flowrate'.
-        # I'll stick to kg/s if I want SI.
-        "valve_opening_pct": [initial_opening],
-        "flow_regime": ["None"],
-        "dp_dt_upstream": [0.0],
-        "dp_dt_downstream": [0.0],
-        "z_factor": [round(Z, 4)],
-        "k_ratio": [round(k, 4)],
-        "molar_mass": [round(M, 2)],
-    }
+def _exponential_schedule(
+    t: np.ndarray, opening_time: float, k_curve: float
+) -> np.ndarray:
+    """Exponential growth: slow start, steep end."""
+    if opening_time <= 0:
+        return np.ones_like(t)
+    ratio = np.minimum(t / opening_time, 1.0)
+    return (np.exp(k_curve * ratio) - 1) / (np.exp(k_curve) - 1)
 
 
-def _calculate_valve_opening_fraction(
-    t: float,
+def _quick_acting_schedule(
+    t: np.ndarray, opening_time: float, k_curve: float
+) -> np.ndarray:
+    """Quick rise: fast initial jump, then levels off."""
+    if opening_time <= 0:
+        return np.ones_like(t)
+    ratio = np.minimum(t / opening_time, 1.0)
+    numerator = 1 - np.exp(-k_curve * ratio)
+    denominator = 1 - np.exp(-k_curve)
+    return numerator / denominator
+
+
+def _fixed_schedule(t: np.ndarray, opening_time: float, k_curve: float) -> np.ndarray:
+    """Valve at its final position from the first step."""
+    return np.ones_like(t)
+
+
+# Opening curve per opening mode: (t, opening_time, k_curve) -> fraction open
+_OPENING_SCHEDULES: dict[str, Callable[[np.ndarray, float, float], np.ndarray]] = {
+    "linear": _linear_schedule,
+    "exponential": _exponential_schedule,
+    "quick_acting": _quick_acting_schedule,
+    "fixed": _fixed_schedule,
+}
+
+
+def _calculate_opening_schedule(
+    dt: float,
     opening_time: float,
     valve_action: Literal["open", "close"],
     opening_mode: Literal["linear", "exponential", "quick_acting", "fixed"],
     k_curve: float,
-) -> float:
-    """Calculate valve opening fraction (0.0 to 1.0) based on time and opening mode.
+) -> np.ndarray:
+    """Precompute the valve opening fraction (0.0 to 1.0) for every time step.
+
+    Entry i is the opening fraction at t = (i + 1) * dt. The schedule only covers
+    the valve travel: once the valve has fully opened or closed the fraction no
+    longer changes, so steps past the end of the schedule use its last entry.
 
     Args:
-        t: Current simulation time in seconds.
+        dt: Time step in seconds.
         opening_time: Time for valve to fully open in seconds.
         valve_action: "open" or "close".
         opening_mode: Type of valve opening curve.
         k_curve: Curve steepness parameter for exponential/quick_acting modes.
 
     Returns:
-        Opening fraction from 0.0 (fully closed) to 1.0 (fully open).
+        Array of opening fractions from 0.0 (fully closed) to 1.0 (fully open).
     """
-    if opening_mode == "fixed":
-        return 1.0 if valve_action == "open" else 0.0
-
-    if opening_time <= 0:
-        return 0.0 if valve_action == "close" else 1.0
-
-    ratio = min(t / opening_time, 1.0)
+    if opening_mode == "fixed" or opening_time <= 0:
+        n_travel = 1
+    else:
+        # One extra step so the schedule always ends on the fully open/closed value
+        n_travel = int(np.ceil(opening_time / dt)) + 1
+    t = dt * np.arange(1, n_travel + 1)
 
-    if opening_mode == "exponential":
-        # Exponential growth: slow start, steep end
-        curve_fraction = (np.exp(k_curve * ratio) - 1) / (np.exp(k_curve) - 1)
-    elif opening_mode == "quick_acting":
-        # Quick rise: fast initial jump, then levels off
-        numerator = 1 - np.exp(-k_curve * ratio)
-        denominator = 1 - np.exp(-k_curve)
-        curve_fraction = numerator / denominator
-    else:  # linear (default)
-        curve_fraction = ratio
+    schedule = _OPENING_SCHEDULES.get(opening_mode, _linear_schedule)
+    curve_fraction = schedule(t, opening_time, k_curve)
 
     # Invert for closing mode
     return (1.0 - curve_fraction) if valve_action == "close" else curve_fraction
@@ -262,6 +293,10 @@ def _update_gas_properties(
 ) -> tuple[float, float, float]:
     """Update gas properties dynamically in composition mode.
 
+    Properties are interpolated from the table built when the state was
+    initialized: at the downstream pressure, or at the upstream pressure when
+    depressurizing.
+
     Args:
         state: Current simulation state.
         P_up: Current upstream pressure in Pa.
@@ -271,21 +306,21 @@ def _update_gas_properties(
     Returns:
         Tuple of (M, Z, k) - updated properties.
     """
-    if mode == "equalize" and state.gas_state_up and state.gas_state_down:
-        props_up = state.gas_state_up.get_properties(P_up, state.T_up)
-        props_down = state.gas_state_down.get_properties(P_down, state.T_down)
-        return props_down.M, props_down.Z, props_down.k
-    elif mode == "pressurize" and state.gas_state_down:
-        props_down = state.gas_state_down.get_properties(P_down, state.T_down)
-        return props_down.M, props_down.Z, props_down.k
-    elif mode == "depressurize" and state.gas_state_up:
-        props_up = state.gas_state_up.get_properties(P_up, state.T_up)
-        return props_up.M, props_up.Z, props_up.k
-    else:
+    if state.property_table is None:
         return state.M, state.Z, state.k
 
+    pressures, Zs, ks, Ms = state.property_table
+    P = P_up if mode == "depressurize" else P_down
+    return (
+        float(np.interp(P, pressures, Ms)),
+        float(np.interp(P, pressures, Zs)),
+        float(np.interp(P, pressures, ks)),
+    )
+
 
-def _calculate_flow_regime_and_mass_flow(
+@njit(cache=True)
+def _calculate_step(
+    mode: Literal["pressurize", "depressurize", "equalize"],
     P_up: float,
     P_down: float,
     A: float,
@@ -294,10 +329,14 @@ def _calculate_flow_regime_and_mass_flow(
     Z: float,
     T: float,
     Cd: float,
-) -> tuple[str, float]:
-    """Calculate flow regime and mass flow rate.
+    V_up: float,
+    V_down: float,
+    r_c: float,
+) -> tuple[int, float, float, float]:
+    """Calculate flow regime, mass flow rate and pressure rates for one step.
 
     Args:
+        mode: Simulation mode.
         P_up: Upstream pressure in Pa.
         P_down: Downstream pressure in Pa.
         A: Valve opening area in m².
@@ -306,70 +345,28 @@ def _calculate_flow_regime_and_mass_flow(
         Z: Compressibility factor.
         T: Temperature in K.
         Cd: Discharge coefficient.
-
-    Returns:
-        Tuple of (regime, massflow_kgs).
-    """
-    pressure_diff = P_up - P_down
-
-    if abs(pressure_diff) < EQUILIBRIUM_TOLERANCE_PA:  # Effectively equilibrium
-        return "Equilibrium", 0.0
-
-    r = P_down / P_up if P_up > 0 else 1.0
-    r_c = calculate_critical_pressure_ratio(k)
-    regime = "Choked" if r <= r_c else "Subsonic"
-
-    massflow_kgs = calculate_mass_flow_rate(Cd, A, P_up, P_down, k, M, Z, T)
-    if abs(massflow_kgs) < EQUILIBRIUM_TOLERANCE_KGS:
-        massflow_kgs = 0.0
-        regime = "Equilibrium"
-    return regime, massflow_kgs
-
-
-def _calculate_pressure_rates(
-    mode: Literal["pressurize", "depressurize", "equalize"],
-    pressure_diff: float,
-    massflow_kgs: float,
-    Z: float,
-    T: float,
-    V_up: float,
-    V_down: float,
-    M: float,
-) -> tuple[float, float]:
-    """Calculate pressure rate of change for both vessels.
-
-    Args:
-        mode: Simulation mode.
-        pressure_diff: P_up - P_down in Pa.
-        massflow_kgs: Mass flow rate in kg/s.
-        Z: Compressibility factor.
-        T: Temperature in K.
         V_up: Upstream volume in m³.
         V_down: Downstream volume in m³.
-        M: Molar mass in g/mol.
+        r_c: Critical pressure ratio for k.
 
     Returns:
-        Tuple of (dp_dt_up, dp_dt_down) in Pa/s.
+        Tuple of (regime code, massflow_kgs, dp_dt_up, dp_dt_down).
     """
-    if abs(pressure_diff) < EQUILIBRIUM_TOLERANCE_PA:
-        return 0.0, 0.0
+    pressure_diff = P_up - P_down
 
-    mass_flow_up = -massflow_kgs
-    mass_flow_down = massflow_kgs
+    if abs(pressure_diff) < EQUILIBRIUM_TOLERANCE_PA:  # Effectively equilibrium
+        return REGIME_EQUILIBRIUM, 0.0, 0.0, 0.0
 
-    dp_dt_up, dp_dt_down = calculate_dual_dp_dt(
-        mode=mode,
-        mass_flow_upstream=mass_flow_up,
-        mass_flow_downstream=mass_flow_down,
-        z_factor=Z,
-        temperature=T,
-        upstream_volume=V_up,
-        downstream_volume=V_down,
-        molar_mass_g_mol=M,
+    choked, massflow_kgs, dp_dt_up, dp_dt_down = calculate_valve_flow(
+        mode, Cd, A, P_up, P_down, k, M, Z, T, V_up, V_down, r_c
     )
-    return dp_dt_up, dp_dt_down
+    if abs(massflow_kgs) < EQUILIBRIUM_TOLERANCE_KGS:
+        return REGIME_EQUILIBRIUM, 0.0, 0.0, 0.0
+    regime = REGIME_CHOKED if choked else REGIME_SUBSONIC
+    return regime, massflow_kgs, dp_dt_up, dp_dt_down
 
 
+@njit(cache=True)
 def _update_pressures(
     P_up: float,
     P_down: float,
@@ -401,93 +398,218 @@ def _update_pressures(
     return P_up, P_down
 
 
+@njit(cache=True)
 def _check_stopping_condition(
     valve_action: Literal["open", "close"],
     opening_fraction: float,
-    regime: str,
+    regime: int,
 ) -> bool:
     """Check if simulation should stop.
 
     Args:
         valve_action: "open" or "close".
         opening_fraction: Current valve opening (0.0 to 1.0).
-        regime: Current flow regime.
-        P_up: Current upstream pressure in Pa.
+        regime: Current flow regime code.
 
     Returns:
         True if simulation should stop, False otherwise.
     """
     if valve_action == "close":
         # For closing: stop when valve reaches 0% (fully closed)
-        should_stop = opening_fraction <= 0.0
-        if should_stop:
-            logger.debug(
-                f"Stopping condition met for closing valve: opening_fraction={opening_fraction:.6f} <= 0.0"
-            )
-    else:
-        # For opening: stop when valve reaches 100% AND pressure equilibrium
-        should_stop = regime == "Equilibrium" and opening_fraction >= 1.0
-        if should_stop:
-            logger.debug(
-                f"Stopping condition met for opening valve: opening_fraction={opening_fraction:.6f} >= 1.0 "
-            )
+        return opening_fraction <= 0.0
 
-    return should_stop
+    # For opening: stop when valve reaches 100% AND pressure equilibrium
+    return regime == REGIME_EQUILIBRIUM and opening_fraction >= 1.0
 
 
-def _append_step_results(
-    results: dict,
+@njit(cache=True)
+def _run_steps(
+    out: np.ndarray,
+    times: np.ndarray,
+    regimes: np.ndarray,
+    n_steps: int,
+    step: int,
     t: float,
+    dt: float,
+    dt_min: float,
+    dt_max: float,
+    quiet_steps: int,
+    max_time: float,
     P_up: float,
     P_down: float,
-    opening_fraction: float,
-    massflow_kgs: float,
-    regime: str,
-    dp_dt_up: float,
-    dp_dt_down: float,
+    M: float,
     Z: float,
     k: float,
-    M: float,
-) -> None:
-    """Append current simulation step results to results dictionary.
+    A_max: float,
+    Cd: float,
+    T: float,
+    V_up: float,
+    V_down: float,
+    mode: Literal["pressurize", "depressurize", "equalize"],
+    valve_action: Literal["open", "close"],
+    opening_schedule: np.ndarray,
+    P_props: float,
+    props_rtol: float,
+) -> tuple[int, float, float, int, float, float, bool]:
+    """Advance the simulation by up to n_steps time steps with fixed gas properties.
+
+    This is the inner time-stepping loop. It only touches scalars and the
+    preallocated buffers, so it runs as compiled code when Numba is installed.
+
+    With dt_min < dt_max the time step adapts: it doubles once the pressures
+    have been quiet for ADAPTIVE_QUIET_STEPS steps and halves (down to dt_min)
+    whenever a step would push the pressures past each other. Passing
+    dt_min == dt_max == dt gives a uniform time step.
 
     Args:
-        results: Results dictionary to append to.
-        t: Current time in seconds.
-        P_up: Upstream pressure in Pa.
-        P_down: Downstream pressure in Pa.
-        opening_fraction: Valve opening (0.0 to 1.0).
-        massflow_kgs: Mass flow rate in kg/s.
-        regime: Flow regime string.
-        dp_dt_up: Upstream pressure rate in Pa/s.
-        dp_dt_down: Downstream pressure rate in Pa/s.
+        out: Step buffer of shape (>= n_steps, len(RESULT_COLUMNS)), filled row by row
+            except for the time column.
+        times: Time buffer of length >= n_steps, float64 regardless of out's dtype.
+            May be a view of out's time column.
+        regimes: Flow regime code buffer of length >= n_steps.
+        n_steps: Maximum number of steps to take.
+        step: Number of steps taken so far, used to index the opening schedule.
+        t: Current simulation time in seconds.
+        dt: Current time step in seconds.
+        dt_min: Smallest allowed time step in seconds.
+        dt_max: Largest allowed time step in seconds.
+        quiet_steps: Consecutive quiet steps carried over from the previous call.
+        max_time: Maximum simulation time in seconds.
+        P_up: Current upstream pressure in Pa.
+        P_down: Current downstream pressure in Pa.
+        M: Molar mass in g/mol.
         Z: Compressibility factor.
         k: Heat capacity ratio.
-        M: Molar mass in g/mol.
+        A_max: Fully open valve area in m².
+        Cd: Discharge coefficient.
+        T: Temperature in K.
+        V_up: Upstream volume in m³.
+        V_down: Downstream volume in m³.
+        mode: Simulation mode.
+        valve_action: "open" or "close".
+        opening_schedule: Opening fraction per step from _calculate_opening_schedule.
+        P_props: Pressure in Pa at which M, Z and k were evaluated.
+        props_rtol: Relative change of the property pressure (P_up when
+            depressurizing, P_down otherwise) after which the call returns early
+            so the properties can be updated. Use np.inf for fixed properties.
+
+    Returns:
+        Tuple of (steps_taken, t, dt, quiet_steps, P_up, P_down, stopped). stopped
+        is True once the stopping condition is met or max_time is reached.
+    """
+    # k is fixed for the whole call, so the critical ratio is too
+    r_c = calculate_critical_pressure_ratio(k)
+    last = len(opening_schedule) - 1
+    for i in range(n_steps):
+        if t >= max_time:
+            return i, t, dt, quiet_steps, P_up, P_down, True
+
+        opening_fraction = opening_schedule[min(step + i, last)]
+        A = A_max * opening_fraction
+
+        regime, massflow_kgs, dp_dt_up, dp_dt_down = _calculate_step(
+            mode, P_up, P_down, A, k, M, Z, T, Cd, V_up, V_down, r_c
+        )
+
+        # Shorten the step while it would overshoot the equilibrium pressure
+        while (
+            dt > dt_min
+            and (P_up + dp_dt_up * dt) - (P_down + dp_dt_down * dt)
+            < -EQUILIBRIUM_TOLERANCE_PA
+        ):
+            dt = max(dt * 0.5, dt_min)
+            quiet_steps = 0
+
+        t += dt
+        P_up, P_down = _update_pressures(P_up, P_down, dp_dt_up, dp_dt_down, dt)
+
+        times[i] = t
+        out[i, 1] = P_up
+        out[i, 2] = P_down
+        out[i, 3] = massflow_kgs  # Storing kg/s
+        out[i, 4] = opening_fraction * 100
+        out[i, 5] = dp_dt_up
+        out[i, 6] = dp_dt_down
+        out[i, 7] = Z
+        out[i, 8] = k
+        out[i, 9] = M
+        regimes[i] = regime
+
+        if _check_stopping_condition(valve_action, opening_fraction, regime):
+            return i + 1, t, dt, quiet_steps, P_up, P_down, True
+
+        # Lengthen the step once the pressures have settled
+        dP = max(abs(dp_dt_up), abs(dp_dt_down)) * dt
+        if dP < ADAPTIVE_DP_RTOL * P_up:
+            quiet_steps += 1
+            if quiet_steps >= ADAPTIVE_QUIET_STEPS:
+                dt = min(dt * 2, dt_max)
+                quiet_steps = 0
+        else:
+            quiet_steps = 0
+
+        P_ref = P_up if mode == "depressurize" else P_down
+        if abs(P_ref - P_props) > props_rtol * P_props:
+            return i + 1, t, dt, quiet_steps, P_up, P_down, False
+
+    return n_steps, t, dt, quiet_steps, P_up, P_down, False
+
+
+def _format_rows(rows: np.ndarray, pressure_offset: float) -> np.ndarray:
+    """Return a copy of step buffer rows with the offset and display rounding applied.
+
+    Args:
+        rows: Step buffer rows in RESULT_COLUMNS order.
+        pressure_offset: Pressure in Pa subtracted from the reported pressures.
+
+    Returns:
+        Formatted copy of rows.
     """
-    # PintGlass Output fields expect SI base units, so we store Pa directly.
-    # Flowrate is float in schema, so we can decide unit. Previously lb/hr.
-    # Let's keep flowrate as kg/s if we want to be fully SI internal?
-    # But wait, the schema said flowrate: float. If I give it kg/s, the user will see kg/s.
-    # The previous version converted to lb/hr.
-    # Ideally, flowrate should also be a PintGlass field if we want auto-conversion.
-    # But for now I'll store kg/s and let the user handle it or update schema later.
-    # Actually, let's stick to kg/s for cleaner physics.
-    # NOTE: If frontend expects lb/hr, this is a breaking change.
-    # I will assume frontend will be updated to handle unit selection or generic units.
-
-    results["time"].append(round(t, 2))
-    results["pressure"].append(P_down)
-    results["upstream_pressure"].append(P_up)
-    results["downstream_pressure"].append(P_down)
-    results["flowrate"].append(massflow_kgs)  # Storing kg/s
-    results["valve_opening_pct"].append(round(opening_fraction * 100, 1))
-    results["flow_regime"].append(regime)
-    results["dp_dt_upstream"].append(dp_dt_up)
-    results["dp_dt_downstream"].append(dp_dt_down)
-    results["z_factor"].append(round(Z, 4))
-    results["k_ratio"].append(round(k, 4))
-    results["molar_mass"].append(round(M, 2))
+    # Round the display columns once per batch instead of per value
+    rows = rows.copy()
+    rows[:, 1:3] -= pressure_offset  # upstream/downstream pressure
+    rows[:, 0] = np.round(rows[:, 0], 2)  # time
+    rows[:, 4] = np.round(rows[:, 4], 1)  # valve_opening_pct
+    rows[:, 7:9] = np.round(rows[:, 7:9], 4)  # z_factor, k_ratio
+    rows[:, 9] = np.round(rows[:, 9], 2)  # molar_mass
+    return rows
+
+
+def _buffer_rows(
+    out: np.ndarray, regimes: np.ndarray, n_rows: int, pressure_offset: float = 0.0
+) -> Generator[dict, None, None]:
+    """Yield the first n_rows of the step buffer as result row dictionaries.
+
+    Args:
+        out: Step buffer filled by _run_steps.
+        regimes: Flow regime code buffer filled by _run_steps.
+        n_rows: Number of valid rows in the buffers.
+        pressure_offset: Pressure in Pa subtracted from the reported pressures.
+
+    Yields:
+        Dictionary representing a single simulation row.
+    """
+    rows = _format_rows(out[:n_rows], pressure_offset)
+    regime_names = _REGIME_NAMES[regimes[:n_rows]].tolist()
+
+    # PintGlass Output fields expect SI base units, so pressures stay in Pa
+    # and flowrate in kg/s.
+    for row, regime in zip(rows.tolist(), regime_names, strict=True):
+        t, P_up, P_down, massflow_kgs, opening_pct, dp_dt_up, dp_dt_down, Z, k, M = row
+        yield {
+            "time": t,
+            "pressure": P_down,
+            "upstream_pressure": P_up,
+            "downstream_pressure": P_down,
+            "flowrate": massflow_kgs,
+            "valve_opening_pct": opening_pct,
+            "flow_regime": regime,
+            "dp_dt_upstream": dp_dt_up,
+            "dp_dt_downstream": dp_dt_down,
+            "z_factor": Z,
+            "k_ratio": k,
+            "molar_mass": M,
+        }
 
 
 def _calculate_max_simulation_time(
@@ -513,6 +635,34 @@ def _calculate_max_simulation_time(
         return opening_time * 10  # Opening: 10x opening time for equilibrium
 
 
+def _calculate_step_limits(
+    dt: float,
+    opening_mode: Literal["linear", "exponential", "quick_acting", "fixed"],
+    adaptive_dt: bool,
+    property_update_stride: int,
+) -> tuple[float, float]:
+    """Return the allowed time step range for the stepping options.
+
+    A property_update_stride below 1 raises ValueError.
+
+    Args:
+        dt: Initial time step in seconds.
+        opening_mode: Type of valve opening curve.
+        adaptive_dt: Whether the time step may grow in the fixed opening mode.
+        property_update_stride: Steps between gas property updates.
+
+    Returns:
+        Tuple of (dt_min, dt_max) in seconds.
+    """
+    if property_update_stride < 1:
+        raise ValueError("property_update_stride must be at least 1")
+
+    # The opening schedule is indexed by step, so only a fixed valve may vary dt
+    if adaptive_dt and opening_mode == "fixed":
+        return dt, dt * ADAPTIVE_DT_MAX_FACTOR
+    return dt, dt
+
+
 def run_simulation_streaming(
     P_up: float,
     P_down_init: float,
@@ -534,9 +684,23 @@ def run_simulation_streaming(
     composition: str | None = None,
     mode: Literal["pressurize", "depressurize", "equalize"] = "equalize",
     should_stop_callback: Callable[[], bool] | None = None,
+    property_update_stride: int = PROPERTY_UPDATE_STRIDE,
+    adaptive_dt: bool = False,
+    pressure_offset: float = 0.0,
 ) -> Generator[dict, None, None]:
     """Run the valve pressurization simulation as a generator that yields batches of results.
 
+    In composition mode the gas properties are updated every
+    property_update_stride steps, or sooner once the pressure they were evaluated
+    at has changed by more than PROPERTY_UPDATE_RTOL.
+
+    With adaptive_dt and the fixed opening mode, dt is only the initial and
+    smallest time step: it grows up to ADAPTIVE_DT_MAX_FACTOR * dt in the slow
+    approach to equilibrium, so rows are no longer evenly spaced in time.
+
+    Pressures are simulated in absolute Pa. pressure_offset is subtracted from
+    every reported pressure, e.g. ATM_PA to stream gauge pressures.
+
     Yields:
         Dictionary representing a single simulation row with all computed values.
     """
@@ -564,23 +728,12 @@ def run_simulation_streaming(
         downstream_temp=downstream_temp,
     )
 
-    # Initialize results storage
-    results = _initialize_results(
-        P_up=P_up,
-        P_down_init=P_down_init,
-        valve_action=valve_action,
-        opening_mode=opening_mode,
-        Z=state.Z,
-        k=state.k,
-        M=state.M,
-    )
-
     # Yield initial row
     yield {
         "time": 0,
-        "pressure": P_down_init,
-        "upstream_pressure": P_up,
-        "downstream_pressure": P_down_init,
+        "pressure": P_down_init - pressure_offset,
+        "upstream_pressure": P_up - pressure_offset,
+        "downstream_pressure": P_down_init - pressure_offset,
         "flowrate": 0,
         "valve_opening_pct": 100.0
         if (valve_action == "close" or opening_mode == "fixed")
@@ -601,148 +754,367 @@ def run_simulation_streaming(
     )
     logger.debug(f"Calculated max simulation time: {max_time}s")
 
+    dt_min, dt_max = _calculate_step_limits(
+        dt=dt,
+        opening_mode=opening_mode,
+        adaptive_dt=adaptive_dt,
+        property_update_stride=property_update_stride,
+    )
+    quiet_steps = 0
+
+    # Valve opening fraction for every step, computed once up front
+    opening_schedule = _calculate_opening_schedule(
+        dt=dt,
+        opening_time=opening_time,
+        valve_action=valve_action,
+        opening_mode=opening_mode,
+        k_curve=k_curve,
+    )
+
     # Main simulation loop
-    t: float = 0
-    P_up = state.P_up
-    P_down = state.P_down
-    M = state.M
-    Z = state.Z
-    k = state.k
+    t = 0.0
+    P_up = float(state.P_up)
+    P_down = float(state.P_down)
     step_count = 0
-    P_up_current = P_up
-    P_down_current = P_down_init
-
-    while t < max_time:
+    stopped = False
+
+    # Loop-invariant step kernel inputs, bound once instead of per step
+    A_max = state.A_max
+    Cd = state.Cd
+    T = state.T_up
+    V_up = state.V_up
+    V_down = state.V_down
+
+    # Manual mode keeps gas properties fixed, so a whole batch runs in one kernel
+    # call. Composition mode updates the properties every property_update_stride
+    # steps, or earlier when the kernel reports a large pressure change.
+    fixed_properties = state.property_table is None
+    props_rtol = np.inf if fixed_properties else PROPERTY_UPDATE_RTOL
+    steps_since_update = 0
+    M, Z, k = state.M, state.Z, state.k
+    P_props = P_up if mode == "depressurize" else P_down
+
+    # Step buffers, reused for every batch of YIELD_BATCH_SIZE rows
+    out = np.empty((YIELD_BATCH_SIZE, len(RESULT_COLUMNS)))
+    regimes = np.empty(YIELD_BATCH_SIZE, dtype=np.int8)
+
+    while not stopped:
         # Check for abort signal
         if should_stop_callback and should_stop_callback():
             logger.info(f"Simulation aborted by user at t={t:.2f}s")
             break
 
-        t += dt
-        step_count += 1
-
-        # Calculate valve opening fraction
-        opening_fraction = _calculate_valve_opening_fraction(
-            t=t,
-            opening_time=opening_time,
-            valve_action=valve_action,
-            opening_mode=opening_mode,
-            k_curve=k_curve,
-        )
+        n_rows = 0
+        while n_rows < YIELD_BATCH_SIZE and not stopped:
+            n_steps = YIELD_BATCH_SIZE - n_rows
+            if not fixed_properties:
+                if steps_since_update == 0:
+                    # Update gas properties dynamically in composition mode
+                    M, Z, k = _update_gas_properties(
+                        state=state,
+                        P_up=P_up,
+                        P_down=P_down,
+                        mode=mode,
+                    )
+                    P_props = P_up if mode == "depressurize" else P_down
+                n_steps = min(n_steps, property_update_stride - steps_since_update)
+
+            n_taken, t, dt, quiet_steps, P_up, P_down, stopped = _run_steps(
+                out=out[n_rows:],
+                times=out[n_rows:, 0],
+                regimes=regimes[n_rows:],
+                n_steps=n_steps,
+                step=step_count + n_rows,
+                t=t,
+                dt=dt,
+                dt_min=dt_min,
+                dt_max=dt_max,
+                quiet_steps=quiet_steps,
+                max_time=max_time,
+                P_up=P_up,
+                P_down=P_down,
+                M=M,
+                Z=Z,
+                k=k,
+                A_max=A_max,
+                Cd=Cd,
+                T=T,
+                V_up=V_up,
+                V_down=V_down,
+                mode=mode,
+                valve_action=valve_action,
+                opening_schedule=opening_schedule,
+                P_props=P_props,
+                props_rtol=props_rtol,
+            )
+            n_rows += n_taken
 
-        A = state.A_max * opening_fraction
+            if not fixed_properties:
+                steps_since_update += n_taken
+                # Update after a full stride, or early if the kernel returned
+                # because the pressure moved too far from P_props
+                if steps_since_update >= property_update_stride or n_taken < n_steps:
+                    steps_since_update = 0
 
-        # Update gas properties dynamically in composition mode
-        M, Z, k = _update_gas_properties(
-            state=state,
-            P_up=P_up,
-            P_down=P_down,
-            mode=mode,
-        )
+        step_count += n_rows
 
-        # Calculate flow regime and mass flow rate
-        regime, massflow_kgs = _calculate_flow_regime_and_mass_flow(
-            P_up=P_up,
-            P_down=P_down,
-            A=A,
-            k=k,
-            M=M,
-            Z=Z,
-            T=state.T_up,
-            Cd=state.Cd,
-        )
+        # Yield the batch of results
+        yield from _buffer_rows(out, regimes, n_rows, pressure_offset)
 
-        # Calculate pressure rates of change
-        pressure_diff = P_up - P_down
-        dp_dt_up, dp_dt_down = _calculate_pressure_rates(
-            mode=mode,
-            pressure_diff=pressure_diff,
-            massflow_kgs=massflow_kgs,
-            Z=Z,
-            T=state.T_up,
-            V_up=state.V_up,
-            V_down=state.V_down,
-            M=M,
+    if stopped:
+        logger.info(
+            f"Simulation stopped at t={t:.2f}s: "
+            f"P_up={P_up:.0f} Pa, P_down={P_down:.0f} Pa"
         )
 
-        # Update pressures
-        P_up, P_down = _update_pressures(
-            P_up=P_up,
-            P_down=P_down,
-            dp_dt_up=dp_dt_up,
-            dp_dt_down=dp_dt_down,
-            dt=dt,
-        )
+    logger.info(
+        f"Streaming simulation completed: {step_count + 1} steps, final_time={t:.2f}s"
+    )
+
+
+def _run_simulation_to_frame(params: dict[str, Any]) -> pd.DataFrame:
+    """Run one simulation to completion and collect its rows into a DataFrame."""
+    df = pd.DataFrame(list(run_simulation_streaming(**params)))
+    # One byte per row instead of a string object, also when sent between processes
+    df["flow_regime"] = pd.Categorical(df["flow_regime"], categories=FLOW_REGIMES)
+    return df
+
+
+def run_simulation_batch(
+    param_dicts: Iterable[dict[str, Any]], n_workers: int | None = None
+) -> list[pd.DataFrame]:
+    """Run independent simulations in parallel worker processes.
+
+    Intended for parameter sweeps. Each simulation is a pure function of its
+    inputs, so the runs scale with the number of CPU cores.
+
+    Args:
+        param_dicts: Keyword arguments for run_simulation_streaming, one dict per
+            run. Values must be picklable, so should_stop_callback is not supported.
+        n_workers: Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        One DataFrame of simulation rows per parameter dict, in input order, with
+        flow_regime as a categorical column over FLOW_REGIMES.
+    """
+    # Spawned workers, since forking a process that has already started Numba's
+    # parallel threads (run_simulation_grid) can deadlock the children
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp_context) as executor:
+        return list(executor.map(_run_simulation_to_frame, param_dicts))
+
+
+@njit(parallel=True, cache=True)
+def _run_grid(
+    out: np.ndarray,
+    times: np.ndarray,
+    regimes: np.ndarray,
+    lens: np.ndarray,
+    P_ups: np.ndarray,
+    A_maxs: np.ndarray,
+    P_down: float,
+    dt: float,
+    max_time: float,
+    M: float,
+    Z: float,
+    k: float,
+    Cd: float,
+    T: float,
+    V_up: float,
+    V_down: float,
+    mode: Literal["pressurize", "depressurize", "equalize"],
+    valve_action: Literal["open", "close"],
+    opening_schedule: np.ndarray,
+) -> None:
+    """Run one fixed-property simulation per grid point, in parallel with Numba.
 
-        P_up_current = P_up
-        P_down_current = P_down
-
-        # Append to results buffer
-        _append_step_results(
-            results=results,
-            t=t,
-            P_up=P_up_current,
-            P_down=P_down_current,
-            opening_fraction=opening_fraction,
-            massflow_kgs=massflow_kgs,
-            regime=regime,
-            dp_dt_up=dp_dt_up,
-            dp_dt_down=dp_dt_down,
-            Z=Z,
-            k=k,
-            M=M,
+    Args:
+        out: Step buffers of shape (n, max_steps, len(RESULT_COLUMNS)), float32.
+            The time column is left unset.
+        times: Time buffers of shape (n, max_steps), float64.
+        regimes: Flow regime code buffers of shape (n, max_steps).
+        lens: Receives the number of steps taken per grid point.
+        P_ups: Upstream pressure per grid point in Pa.
+        A_maxs: Fully open valve area per grid point in m².
+        P_down: Initial downstream pressure in Pa.
+        dt: Time step in seconds.
+        max_time: Maximum simulation time in seconds.
+        M: Molar mass in g/mol.
+        Z: Compressibility factor.
+        k: Heat capacity ratio.
+        Cd: Discharge coefficient.
+        T: Temperature in K.
+        V_up: Upstream volume in m³.
+        V_down: Downstream volume in m³.
+        mode: Simulation mode.
+        valve_action: "open" or "close".
+        opening_schedule: Opening fraction per step from _calculate_opening_schedule.
+    """
+    for i in prange(len(P_ups)):
+        n_taken, _, _, _, _, _, _ = _run_steps(
+            out[i],
+            times[i],
+            regimes[i],
+            out.shape[1],
+            0,
+            0.0,
+            dt,
+            dt,
+            dt,
+            0,
+            max_time,
+            P_ups[i],
+            P_down,
+            M,
+            Z,
+            k,
+            A_maxs[i],
+            Cd,
+            T,
+            V_up,
+            V_down,
+            mode,
+            valve_action,
+            opening_schedule,
+            1.0,
+            np.inf,
         )
+        lens[i] = n_taken
 
-        # Yield batch of results every YIELD_BATCH_SIZE steps for performance
-        if step_count % YIELD_BATCH_SIZE == 0:
-            # Get the last YIELD_BATCH_SIZE rows
-            for i in range(-YIELD_BATCH_SIZE, 0):
-                yield {
-                    "time": results["time"][i],
-                    "pressure": results["pressure"][i],
-                    "upstream_pressure": results["upstream_pressure"][i],
-                    "downstream_pressure": results["downstream_pressure"][i],
-                    "flowrate": results["flowrate"][i],
-                    "valve_opening_pct": results["valve_opening_pct"][i],
-                    "flow_regime": results["flow_regime"][i],
-                    "dp_dt_upstream": results["dp_dt_upstream"][i],
-                    "dp_dt_downstream": results["dp_dt_downstream"][i],
-                    "z_factor": results["z_factor"][i],
-                    "k_ratio": results["k_ratio"][i],
-                    "molar_mass": results["molar_mass"][i],
-                }
-
-        # Check stopping condition
-        if _check_stopping_condition(
-            valve_action=valve_action,
-            opening_fraction=opening_fraction,
-            regime=regime,
-        ):
-            logger.info(
-                f"Simulation stopped at t={t:.2f}s: valve_opening={opening_fraction:.3f}, "
-                f"P_up={P_up_current:.0f} Pa, P_down={P_down_current:.0f} Pa"
-            )
-            break
 
-    # Yield any remaining rows not yet yielded
-    remaining = step_count % YIELD_BATCH_SIZE
-    if remaining > 0:
-        for i in range(-remaining, 0):
-            yield {
-                "time": results["time"][i],
-                "pressure": results["pressure"][i],
-                "upstream_pressure": results["upstream_pressure"][i],
-                "downstream_pressure": results["downstream_pressure"][i],
-                "flowrate": results["flowrate"][i],
-                "valve_opening_pct": results["valve_opening_pct"][i],
-                "flow_regime": results["flow_regime"][i],
-                "dp_dt_upstream": results["dp_dt_upstream"][i],
-                "dp_dt_downstream": results["dp_dt_downstream"][i],
-                "z_factor": results["z_factor"][i],
-                "k_ratio": results["k_ratio"][i],
-                "molar_mass": results["molar_mass"][i],
-            }
+def run_simulation_grid(
+    P_ups: np.ndarray,
+    valve_ids: np.ndarray,
+    P_down_init: float,
+    opening_time: float,
+    upstream_volume: float,
+    upstream_temp: float,
+    downstream_volume: float,
+    downstream_temp: float,
+    molar_mass: float,
+    z_factor: float,
+    k_ratio: float,
+    discharge_coeff: float = 0.65,
+    valve_action: Literal["open", "close"] = "open",
+    opening_mode: Literal["linear", "exponential", "quick_acting", "fixed"] = "linear",
+    k_curve: float = 4.0,
+    dt: float = TIME_STEP,
+    mode: Literal["pressurize", "depressurize", "equalize"] = "equalize",
+    max_steps: int | None = None,
+) -> list[pd.DataFrame]:
+    """Run a manual-mode sweep over upstream pressure and valve size in one process.
 
-    logger.info(
-        f"Streaming simulation completed: {len(results['time'])} steps, final_time={t:.2f}s"
+    All grid points share the gas properties and the valve schedule, so the runs
+    go through a single compiled kernel that is parallelized across CPU cores
+    when Numba is installed. Unlike run_simulation_batch there is no pickling.
+
+    Args:
+        P_ups: Upstream pressures in Pa. Broadcast against valve_ids.
+        valve_ids: Valve inner diameters in m. Broadcast against P_ups.
+        P_down_init: Initial downstream pressure in Pa.
+        opening_time: Time for valve to fully open in seconds.
+        upstream_volume: Upstream vessel volume in m³.
+        upstream_temp: Upstream vessel temperature in K.
+        downstream_volume: Downstream vessel volume in m³.
+        downstream_temp: Downstream vessel temperature in K.
+        molar_mass: Gas molar mass in g/mol.
+        z_factor: Compressibility factor.
+        k_ratio: Heat capacity ratio Cp/Cv.
+        discharge_coeff: Valve discharge coefficient.
+        valve_action: "open" or "close".
+        opening_mode: Type of valve opening curve.
+        k_curve: Curve steepness parameter for exponential/quick_acting modes.
+        dt: Time step in seconds.
+        mode: Simulation mode.
+        max_steps: Row limit per grid point. Defaults to enough steps to reach the
+            maximum simulation time; lower it to bound memory for long runs.
+
+    Returns:
+        One DataFrame per grid point, with the same rows and columns as
+        run_simulation_batch. Values other than time pass through a float32
+        buffer, so they match run_simulation_batch to about 1e-7 relative.
+    """
+    P_ups, valve_ids = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(P_ups, dtype=np.float64)),
+        np.atleast_1d(np.asarray(valve_ids, dtype=np.float64)),
     )
+    n = P_ups.size
+    P_ups = np.maximum(P_ups.ravel(), 1.0)
+    A_maxs = np.pi * (valve_ids.ravel() / 2) ** 2
+    P_down = max(P_down_init, 1.0)
+
+    max_time = _calculate_max_simulation_time(
+        opening_mode=opening_mode,
+        opening_time=opening_time,
+        valve_action=valve_action,
+    )
+    if max_steps is None:
+        max_steps = int(np.ceil(max_time / dt)) + 1
+    opening_schedule = _calculate_opening_schedule(
+        dt=dt,
+        opening_time=opening_time,
+        valve_action=valve_action,
+        opening_mode=opening_mode,
+        k_curve=k_curve,
+    )
+
+    # The grid buffer dominates memory for long sweeps, so it stores float32.
+    # The kernel still integrates in float64 and only downcasts when storing.
+    # Time keeps float64 so that the time axis of long runs stays exact.
+    out = np.empty((n, max_steps, len(RESULT_COLUMNS)), dtype=np.float32)
+    times = np.empty((n, max_steps))
+    regimes = np.empty((n, max_steps), dtype=np.int8)
+    lens = np.empty(n, dtype=np.int64)
+    _run_grid(
+        out,
+        times,
+        regimes,
+        lens,
+        P_ups,
+        A_maxs,
+        P_down,
+        dt,
+        max_time,
+        molar_mass,
+        z_factor,
+        k_ratio,
+        discharge_coeff,
+        upstream_temp,
+        upstream_volume,
+        downstream_volume,
+        mode,
+        valve_action,
+        opening_schedule,
+    )
+
+    initial_opening_pct = (
+        100.0 if (valve_action == "close" or opening_mode == "fixed") else 0.0
+    )
+    frames = []
+    for i in range(n):
+        # Initial row followed by the simulated steps, as in run_simulation_streaming
+        initial = np.array(
+            [
+                [
+                    0.0,
+                    P_ups[i],
+                    P_down_init,
+                    0.0,
+                    initial_opening_pct,
+                    0.0,
+                    0.0,
+                    z_factor,
+                    k_ratio,
+                    molar_mass,
+                ]
+            ]
+        )
+        steps = out[i, : lens[i]].astype(float)
+        steps[:, 0] = times[i, : lens[i]]
+        rows = _format_rows(np.vstack((initial, steps)), 0.0)
+        codes = np.concatenate(([0], regimes[i, : lens[i]]))
+        df = pd.DataFrame(rows, columns=RESULT_COLUMNS)
+        df.insert(1, "pressure", df["downstream_pressure"])
+        df.insert(6, "flow_regime", pd.Categorical.from_codes(codes, FLOW_REGIMES))
+        frames.append(df)
+    return frames
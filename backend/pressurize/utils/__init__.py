@@ -1,8 +1,17 @@
 """Utility functions for the pressurize package."""
 
+from typing import TypeVar
+
+import numpy as np
+
 ATM_PA = 101325.0  # 1 atmosphere in Pascals
 
+PressureT = TypeVar("PressureT", float, np.ndarray)
+
+
+def absolute_pressure(gauge_pressure_pa: PressureT) -> PressureT:
+    """Convert gauge pressure (Pa) to absolute pressure (Pa).
 
-def absolute_pressure(gauge_pressure_pa: float) -> float:
-    """Convert gauge pressure (Pa) to absolute pressure (Pa)."""
+    Works element-wise on NumPy arrays as well as on scalars.
+    """
     return gauge_pressure_pa + ATM_PA
@@ -1,8 +1,17 @@
 from collections.abc import Generator
+from types import MappingProxyType
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
+from pressurize.core.jit import NUMBA_AVAILABLE
+from pressurize.core.physics import (
+    calculate_choked_flow,
+    calculate_critical_pressure_ratio,
+    calculate_mass_flow_rate,
+    calculate_valve_flow,
+)
 from pressurize.main import app
 
 
@@ -10,3 +19,49 @@ from pressurize.main import app
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as test_client:
         yield test_client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_jit_kernels() -> None:
+    """Compile (or load from Numba's disk cache) the physics kernels up front.
+
+    Keeps JIT latency out of whichever test happens to call a kernel first.
+    No-op when Numba is not installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    r_c = calculate_critical_pressure_ratio(1.3)
+    args = ("equalize", 0.65, 0.001, 3.5e6, 1.0e6, 1.3, 17.0, 0.9, 300.0, 1.0, 1.0)
+    calculate_valve_flow(*args)
+    calculate_valve_flow(*args, r_c)
+
+
+@pytest.fixture(scope="session")
+def mass_flow_rate_vec() -> np.vectorize:
+    """calculate_mass_flow_rate broadcast over NumPy array arguments."""
+    return np.vectorize(calculate_mass_flow_rate, otypes=[float])
+
+
+@pytest.fixture(scope="session")
+def base_params() -> MappingProxyType:
+    """Shared valve inputs for the physics tests, keyed by argument name.
+
+    Read-only so that session-wide sharing cannot leak state between tests.
+    """
+    return MappingProxyType(
+        {
+            "Cd": 0.65,
+            "A": 0.001,  # 1000 mm² in m²
+            "P_up": 3.5e6,  # 3.5 MPa
+            "k": 1.3,
+            "molar_mass_g_mol": 0.017,
+            "Z": 0.9,
+            "T": 300,  # K
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def choked_baseline(base_params) -> float:
+    """Choked mass flow rate at base_params, computed once per session."""
+    return calculate_choked_flow(**base_params)
@@ -1,6 +1,9 @@
 import json
 
 from fastapi.testclient import TestClient
+from pressurize.api import routes
+from pressurize.api.routes import _pack_rows, _unpack_rows
+from pressurize.core.simulation import run_simulation_streaming
 from pressurize.main import app
 
 client = TestClient(app)
@@ -231,6 +234,85 @@ def test_simulation_engg_field_kpis():
     )
 
 
+def test_repeated_simulation_uses_cache(monkeypatch):
+    payload = {
+        "p_up": 300,
+        "p_down_init": 0,
+        "upstream_volume": 100,
+        "upstream_temp": 70,
+        "downstream_volume": 100,
+        "downstream_temp": 70,
+        "valve_id": 0.1667,
+        "opening_time": 5,
+        "molar_mass": 28.97,
+        "z_factor": 1.0,
+        "k_ratio": 1.4,
+        "discharge_coeff": 0.65,
+        "opening_mode": "linear",
+        "dt": 0.5,
+    }
+
+    def run():
+        messages = []
+        with client.stream(
+            "POST",
+            "/simulate/stream",
+            json=payload,
+            headers={"x-unit-system": "imperial"},
+        ) as response:
+            assert response.status_code == 200
+            for line in response.iter_lines():
+                if line.startswith("data: "):
+                    messages.append(json.loads(line[6:]))
+        return messages
+
+    calls = []
+
+    def counting_simulation(**kwargs):
+        calls.append(kwargs)
+        return run_simulation_streaming(**kwargs)
+
+    monkeypatch.setattr(routes, "run_simulation_streaming", counting_simulation)
+
+    client.delete("/simulate/cache")
+    first = run()
+    second = run()
+
+    # The second request is replayed from the cache without simulating
+    assert len(calls) == 1
+    assert first == second
+    assert first[-1]["type"] == "complete"
+
+    response = client.delete("/simulate/cache")
+    assert response.status_code == 200
+    assert response.json() == {"cleared": 1}
+
+
+def test_cached_rows_round_trip():
+    rows = [
+        {
+            "time": t,
+            "pressure": 1.0e5 + t,
+            "upstream_pressure": 3.5e6 - t,
+            "downstream_pressure": 1.0e5 + t,
+            "flowrate": 2.5 * t,
+            "valve_opening_pct": 10.0 * t,
+            "flow_regime": regime,
+            "dp_dt_upstream": -t,
+            "dp_dt_downstream": t,
+            "z_factor": 0.95,
+            "k_ratio": 1.3,
+            "molar_mass": 17.5,
+        }
+        for t, regime in [(0.0, "None"), (0.5, "Choked"), (1.0, "Subsonic")]
+    ]
+
+    values, codes = _pack_rows(rows)
+
+    assert codes.dtype.itemsize == 1
+    assert list(_unpack_rows(values, codes)) == rows
+
+
 def test_property_calculation():
     payload = {
         "composition": "Methane=0.9, Ethane=0.1",
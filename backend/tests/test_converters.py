@@ -4,9 +4,11 @@ Verifies that the API schema correctly converts inputs (assumed Imperial)
 to internal SI units (Pascal, Kelvin, meters, m³).
 """
 
+import numpy as np
 import pytest
 from pint_glass import unit_context
 from pressurize.api.schemas import SimulationRequest
+from pressurize.utils import ATM_PA, absolute_pressure
 
 
 @pytest.fixture(autouse=True)
@@ -113,3 +115,20 @@ class TestSimulationRequestConversion:
 
         assert pytest.approx(req.upstream_volume, abs=0.0001) == 0.0283168
         assert pytest.approx(req.downstream_volume, abs=0.001) == 2.83168
+
+
+class TestAbsolutePressure:
+    """Tests for the gauge to absolute pressure helper."""
+
+    def test_scalar(self):
+        """Test that a scalar gauge pressure is offset by one atmosphere."""
+        assert absolute_pressure(0.0) == ATM_PA
+        assert absolute_pressure(1.0e6) == pytest.approx(1.0e6 + 101325.0)
+
+    def test_array(self):
+        """Test that gauge pressure arrays are converted element-wise."""
+        gauge = np.array([0.0, 1.0e5, 3.5e6])
+        result = absolute_pressure(gauge)
+
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_allclose(result, gauge + 101325.0)
@@ -14,8 +14,10 @@ from pressurize.core.physics import (
     calculate_choked_flow,
     calculate_critical_pressure_ratio,
     calculate_dp_dt,
+    calculate_dual_dp_dt,
     calculate_mass_flow_rate,
     calculate_subsonic_flow,
+    calculate_valve_flow,
 )
 
 
@@ -45,224 +47,120 @@ class TestCriticalPressureRatio:
 
     def test_critical_ratio_range(self):
         """Test that critical ratio is always between 0 and 1."""
-        for k in [1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7]:
-            r_c = calculate_critical_pressure_ratio(k)
-            assert 0 < r_c < 1
+        ks = np.array([1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7])
+        r_c = calculate_critical_pressure_ratio(ks)
+        assert r_c.shape == ks.shape
+        assert np.all((r_c > 0) & (r_c < 1))
 
 
 class TestChokedFlow:
     """Tests for choked flow calculations."""
 
-    def test_choked_flow_positive(self):
+    def test_choked_flow_positive(self, choked_baseline):
         """Test that choked flow produces positive mass flow rate."""
-        Cd = 0.65
-        A = 0.001  # 1000 mm² in m²
-        P_up = 3.5e6  # 3.5 MPa
-        k = 1.3
-        M = 0.017  # 17 g/mol in kg/mol
-        Z = 0.9
-        T = 300  # K
-
-        mass_flow = calculate_choked_flow(Cd, A, P_up, k, M, Z, T)
-        assert mass_flow > 0
-
-    def test_choked_flow_scales_with_area(self):
-        """Test that flow rate doubles when area doubles."""
-        Cd = 0.65
-        A1 = 0.001
-        A2 = 0.002
-        P_up = 3.5e6
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
-
-        mass_flow1 = calculate_choked_flow(Cd, A1, P_up, k, M, Z, T)
-        mass_flow2 = calculate_choked_flow(Cd, A2, P_up, k, M, Z, T)
-
-        assert pytest.approx(mass_flow2, rel=0.01) == 2 * mass_flow1
-
-    def test_choked_flow_scales_with_pressure(self):
-        """Test that flow rate doubles when upstream pressure doubles."""
-        Cd = 0.65
-        A = 0.001
-        P_up1 = 3.5e6
-        P_up2 = 7.0e6
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
+        assert choked_baseline > 0
 
-        mass_flow1 = calculate_choked_flow(Cd, A, P_up1, k, M, Z, T)
-        mass_flow2 = calculate_choked_flow(Cd, A, P_up2, k, M, Z, T)
+    @pytest.mark.parametrize(
+        ("param", "values", "expected_ratio"),
+        [
+            ("A", (0.001, 0.002), 2.0),  # Linear in area
+            ("P_up", (3.5e6, 7.0e6), 2.0),  # Linear in upstream pressure
+            ("T", (300, 400), np.sqrt(300 / 400)),  # Density effect, 1/sqrt(T)
+        ],
+    )
+    def test_choked_flow_scaling(self, base_params, param, values, expected_ratio):
+        """Test how choked flow scales with area, pressure and temperature.
 
-        assert pytest.approx(mass_flow2, rel=0.01) == 2 * mass_flow1
+        The formula is plain NumPy arithmetic, so both cases are evaluated in
+        one call by passing the varied parameter as an array.
+        """
+        inputs = dict(base_params)
+        inputs[param] = np.array(values, dtype=float)
 
-    def test_choked_flow_decreases_with_temperature(self):
-        """Test that flow rate decreases with higher temperature."""
-        Cd = 0.65
-        A = 0.001
-        P_up = 3.5e6
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T1 = 300
-        T2 = 400
-
-        mass_flow1 = calculate_choked_flow(Cd, A, P_up, k, M, Z, T1)
-        mass_flow2 = calculate_choked_flow(Cd, A, P_up, k, M, Z, T2)
+        mass_flow = calculate_choked_flow(**inputs)
 
-        # Higher temperature should reduce flow rate (density effect)
-        assert mass_flow2 < mass_flow1
+        assert mass_flow.shape == (2,)
+        assert pytest.approx(mass_flow[1] / mass_flow[0], rel=0.01) == expected_ratio
 
 
 class TestSubsonicFlow:
     """Tests for subsonic flow calculations."""
 
-    def test_subsonic_flow_positive(self):
+    def test_subsonic_flow_positive(self, base_params):
         """Test that subsonic flow produces positive mass flow rate."""
-        Cd = 0.65
-        A = 0.001
-        P_up = 3.5e6
-        P_down = 2.5e6  # Above critical ratio for k=1.3
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
-
-        mass_flow = calculate_subsonic_flow(Cd, A, P_up, P_down, k, M, Z, T)
+        # 2.5 MPa is above the critical ratio for k=1.3
+        mass_flow = calculate_subsonic_flow(**base_params, P_down=2.5e6)
         assert mass_flow > 0
 
-    def test_subsonic_flow_zero_at_equilibrium(self):
+    def test_subsonic_flow_zero_at_equilibrium(self, base_params):
         """Test that flow is zero when pressures are equal."""
-        Cd = 0.65
-        A = 0.001
-        P = 3.5e6
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
-
-        mass_flow = calculate_subsonic_flow(Cd, A, P, P, k, M, Z, T)
+        mass_flow = calculate_subsonic_flow(**base_params, P_down=base_params["P_up"])
         assert mass_flow == 0.0
 
-    def test_subsonic_flow_zero_when_inverted(self):
+    def test_subsonic_flow_zero_when_inverted(self, base_params):
         """Test that flow is zero when downstream pressure exceeds upstream."""
-        Cd = 0.65
-        A = 0.001
-        P_up = 2.5e6
-        P_down = 3.5e6
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
+        inputs = {**base_params, "P_up": 2.5e6}
 
         # Use calculate_mass_flow_rate which handles inverted pressures
-        mass_flow = calculate_mass_flow_rate(Cd, A, P_up, P_down, k, M, Z, T)
+        mass_flow = calculate_mass_flow_rate(**inputs, P_down=3.5e6)
         assert mass_flow == 0.0
 
-    def test_subsonic_flow_increases_with_pressure_difference(self):
+    def test_subsonic_flow_increases_with_pressure_difference(self, base_params):
         """Test that flow increases with larger pressure differential."""
-        Cd = 0.65
-        A = 0.001
-        P_up = 3.5e6
-        P_down1 = 3.0e6  # Smaller differential
-        P_down2 = 2.5e6  # Larger differential
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
+        # Decreasing downstream pressure, i.e. increasing differential
+        P_downs = np.array([3.4e6, 3.0e6, 2.5e6, 2.1e6])
 
-        mass_flow1 = calculate_subsonic_flow(Cd, A, P_up, P_down1, k, M, Z, T)
-        mass_flow2 = calculate_subsonic_flow(Cd, A, P_up, P_down2, k, M, Z, T)
+        mass_flows = calculate_subsonic_flow(**base_params, P_down=P_downs)
 
         # Larger pressure difference should give higher flow
-        assert mass_flow2 > mass_flow1
+        assert np.all(np.diff(mass_flows) > 0)
 
 
 class TestMassFlowRate:
     """Tests for mass flow rate calculation with automatic regime detection."""
 
-    def test_detects_choked_flow(self):
+    def test_detects_choked_flow(self, base_params):
         """Test that function correctly identifies choked flow conditions."""
-        Cd = 0.65
-        A = 0.001
-        P_up = 3.5e6
         P_down = 1.0e6  # Low enough for choked flow
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
 
-        mass_flow_actual = calculate_mass_flow_rate(Cd, A, P_up, P_down, k, M, Z, T)
+        mass_flow_actual = calculate_mass_flow_rate(**base_params, P_down=P_down)
 
         # Flow should be positive and reasonable
         assert mass_flow_actual > 0
 
         # Test that lowering downstream pressure doesn't increase flow (choked)
-        mass_flow_lower = calculate_mass_flow_rate(
-            Cd, A, P_up, P_down * 0.5, k, M, Z, T
-        )
+        mass_flow_lower = calculate_mass_flow_rate(**base_params, P_down=P_down * 0.5)
         # In choked flow, reducing downstream pressure shouldn't change the flow
         assert pytest.approx(mass_flow_actual, rel=0.05) == mass_flow_lower
 
-    def test_detects_subsonic_flow(self):
+    def test_detects_subsonic_flow(self, base_params):
         """Test that function correctly identifies subsonic flow conditions."""
-        Cd = 0.65
-        A = 0.001
-        P_up = 3.5e6
         P_down = 2.5e6  # High enough for subsonic flow
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
 
-        mass_flow_actual = calculate_mass_flow_rate(Cd, A, P_up, P_down, k, M, Z, T)
+        mass_flow_actual = calculate_mass_flow_rate(**base_params, P_down=P_down)
 
         # Flow should be positive
         assert mass_flow_actual > 0
 
         # Test that lowering downstream pressure increases flow (subsonic behavior)
-        mass_flow_lower = calculate_mass_flow_rate(
-            Cd, A, P_up, P_down * 0.9, k, M, Z, T
-        )
+        mass_flow_lower = calculate_mass_flow_rate(**base_params, P_down=P_down * 0.9)
         assert mass_flow_lower > mass_flow_actual
 
-    def test_zero_at_equilibrium(self):
+    def test_zero_at_equilibrium(self, base_params):
         """Test that flow is zero when pressures are equalized."""
-        Cd = 0.65
-        A = 0.001
-        P = 3.5e6
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
-
-        mass_flow = calculate_mass_flow_rate(Cd, A, P, P, k, M, Z, T)
+        mass_flow = calculate_mass_flow_rate(**base_params, P_down=base_params["P_up"])
         assert mass_flow == 0.0
 
-    def test_transition_at_critical_ratio(self):
+    def test_transition_at_critical_ratio(self, base_params, mass_flow_rate_vec):
         """Test behavior near critical pressure ratio transition."""
-        Cd = 0.65
-        A = 0.001
-        P_up = 3.5e6
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
-
         # Calculate critical pressure ratio
-        r_c = calculate_critical_pressure_ratio(k)
-        P_critical = P_up * r_c
+        r_c = calculate_critical_pressure_ratio(base_params["k"])
+        P_critical = base_params["P_up"] * r_c
 
-        # Just below critical (choked)
-        P_choked = P_critical * 0.99
-        mass_flow_choked = calculate_mass_flow_rate(Cd, A, P_up, P_choked, k, M, Z, T)
-
-        # Just above critical (subsonic)
-        P_subsonic = P_critical * 1.01
-        mass_flow_subsonic = calculate_mass_flow_rate(
-            Cd, A, P_up, P_subsonic, k, M, Z, T
+        # Just below critical (choked) and just above critical (subsonic)
+        P_downs = P_critical * np.array([0.99, 1.01])
+        mass_flow_choked, mass_flow_subsonic = mass_flow_rate_vec(
+            **base_params, P_down=P_downs
         )
 
         # Both should be positive
@@ -276,107 +174,98 @@ class TestMassFlowRate:
 class TestPressureChangeRate:
     """Tests for pressure change rate calculations."""
 
-    def test_pressure_increases_with_positive_flow(self):
-        """Test that pressure increases when gas flows in."""
+    def test_dp_dt_vector_properties(self):
+        """Test sign and scaling of dP/dt with flow, volume and temperature.
+
+        calculate_dp_dt is plain arithmetic, so each sweep is one array call.
+        """
         Z = 0.9
         T = 300
         V = 2.0  # 2 m³
         M = 0.017
-        mass_flow = 0.5  # 0.5 kg/s inflow
 
-        dp_dt = calculate_dp_dt(Z, T, V, M, mass_flow)
-        assert dp_dt > 0
+        # Inflow, outflow, no flow, doubled inflow (kg/s)
+        mass_flows = np.array([0.5, -0.5, 0.0, 1.0])
+        dp_dt = calculate_dp_dt(Z, T, V, M, mass_flows)
+        assert dp_dt[0] > 0  # Pressure increases when gas flows in
+        assert dp_dt[1] < 0  # Pressure decreases when gas flows out
+        assert dp_dt[2] == 0.0  # Pressure is constant with no flow
+        assert pytest.approx(dp_dt[3], rel=0.01) == 2 * dp_dt[0]
 
-    def test_pressure_decreases_with_negative_flow(self):
-        """Test that pressure decreases when gas flows out."""
-        Z = 0.9
-        T = 300
-        V = 2.0
-        M = 0.017
-        mass_flow = -0.5  # 0.5 kg/s outflow
+        # Doubling volume should halve the pressure change rate
+        dp_dt_V = calculate_dp_dt(Z, T, np.array([2.0, 4.0]), M, 0.5)
+        assert pytest.approx(dp_dt_V[1], rel=0.01) == dp_dt_V[0] / 2
 
-        dp_dt = calculate_dp_dt(Z, T, V, M, mass_flow)
-        assert dp_dt < 0
+        # Should scale proportionally with temperature
+        dp_dt_T = calculate_dp_dt(Z, np.array([300.0, 400.0]), V, M, 0.5)
+        assert pytest.approx(dp_dt_T[1] / dp_dt_T[0], rel=0.01) == 400 / 300
 
-    def test_no_pressure_change_with_zero_flow(self):
-        """Test that pressure is constant with no flow."""
-        Z = 0.9
-        T = 300
-        V = 2.0
-        M = 0.017
-        mass_flow = 0.0
 
-        dp_dt = calculate_dp_dt(Z, T, V, M, mass_flow)
-        assert dp_dt == 0.0
+class TestValveFlow:
+    """Tests for the fused mass flow and pressure change rate kernel."""
 
-    def test_pressure_change_scales_with_flow(self):
-        """Test that pressure change rate doubles when flow doubles."""
+    @pytest.mark.parametrize("mode", ["pressurize", "depressurize", "equalize"])
+    @pytest.mark.parametrize("P_down", [1.0e6, 2.5e6])
+    def test_matches_separate_calculations(self, mode, P_down):
+        """Test that the fused kernel matches mass flow followed by dual dp/dt."""
+        Cd = 0.65
+        A = 0.001
+        P_up = 3.5e6
+        k = 1.3
+        M = 17.0
         Z = 0.9
         T = 300
-        V = 2.0
-        M = 0.017
-        mass_flow1 = 0.5
-        mass_flow2 = 1.0
+        V_up = 2.0
+        V_down = 4.0
 
-        dp_dt1 = calculate_dp_dt(Z, T, V, M, mass_flow1)
-        dp_dt2 = calculate_dp_dt(Z, T, V, M, mass_flow2)
+        mass_flow = calculate_mass_flow_rate(Cd, A, P_up, P_down, k, M, Z, T)
+        dp_dt_up, dp_dt_down = calculate_dual_dp_dt(
+            mode, -mass_flow, mass_flow, Z, T, V_up, V_down, M
+        )
 
-        assert pytest.approx(dp_dt2, rel=0.01) == 2 * dp_dt1
+        _, *fused = calculate_valve_flow(
+            mode, Cd, A, P_up, P_down, k, M, Z, T, V_up, V_down
+        )
 
-    def test_pressure_change_inverse_to_volume(self):
-        """Test that pressure change is inversely proportional to volume."""
-        Z = 0.9
-        T = 300
-        V1 = 2.0
-        V2 = 4.0
-        M = 0.017
-        mass_flow = 0.5
+        assert fused == pytest.approx([mass_flow, dp_dt_up, dp_dt_down], rel=1e-9)
 
-        dp_dt1 = calculate_dp_dt(Z, T, V1, M, mass_flow)
-        dp_dt2 = calculate_dp_dt(Z, T, V2, M, mass_flow)
+    def test_precomputed_critical_ratio(self):
+        """Test that passing the critical ratio matches computing it from k."""
+        args = ("equalize", 0.65, 0.001, 3.5e6, 1.0e6, 1.3, 17.0, 0.9, 300, 2.0, 4.0)
+        r_c = calculate_critical_pressure_ratio(1.3)
 
-        # Doubling volume should halve the pressure change rate
-        assert pytest.approx(dp_dt2, rel=0.01) == dp_dt1 / 2
+        assert calculate_valve_flow(*args, r_c) == calculate_valve_flow(*args)
 
-    def test_pressure_change_scales_with_temperature(self):
-        """Test that pressure change rate scales with temperature."""
-        Z = 0.9
-        T1 = 300
-        T2 = 400
-        V = 2.0
-        M = 0.017
-        mass_flow = 0.5
+    @pytest.mark.parametrize("P_down", [0.5e6, 1.5e6, 3.0e6])
+    def test_reports_choked_flow(self, P_down):
+        """Test that the choked flag agrees with the critical pressure ratio."""
+        P_up = 3.5e6
+        k = 1.3
+        choked, *_ = calculate_valve_flow(
+            "equalize", 0.65, 0.001, P_up, P_down, k, 17.0, 0.9, 300, 2.0, 4.0
+        )
 
-        dp_dt1 = calculate_dp_dt(Z, T1, V, M, mass_flow)
-        dp_dt2 = calculate_dp_dt(Z, T2, V, M, mass_flow)
+        assert choked == (P_down / P_up <= calculate_critical_pressure_ratio(k))
 
-        # Should scale proportionally with temperature
-        assert pytest.approx(dp_dt2 / dp_dt1, rel=0.01) == T2 / T1
+    def test_zero_at_equilibrium(self):
+        """Test that flow and pressure rates are zero when pressures are equal."""
+        result = calculate_valve_flow(
+            "equalize", 0.65, 0.001, 3.5e6, 3.5e6, 1.3, 17.0, 0.9, 300, 2.0, 4.0
+        )
+        assert result == (False, 0.0, 0.0, 0.0)
 
 
 class TestIntegration:
     """Integration tests verifying multiple functions work together."""
 
-    def test_flow_regime_transition(self):
+    def test_flow_regime_transition(self, base_params, mass_flow_rate_vec):
         """Test that flow transitions smoothly from choked to subsonic to zero."""
-        Cd = 0.65
-        A = 0.001
-        P_up = 3.5e6
-        k = 1.3
-        M = 0.017
-        Z = 0.9
-        T = 300
-
         # Test various downstream pressures
-        pressures = np.linspace(0, P_up, 20)
-        flow_rates = []
-
-        for P_down in pressures:
-            mass_flow = calculate_mass_flow_rate(Cd, A, P_up, P_down, k, M, Z, T)
-            flow_rates.append(mass_flow)
+        pressures = np.linspace(0, base_params["P_up"], 20)
+        flow_rates = mass_flow_rate_vec(**base_params, P_down=pressures)
 
         # Flow rates should all be non-negative
-        assert all(m >= 0 for m in flow_rates)
+        assert np.all(flow_rates >= 0)
 
         # Flow rate should be zero at equilibrium
         assert flow_rates[-1] == 0.0
@@ -71,6 +71,21 @@ class TestGasStateInitialization:
         assert len(gas.components) == 2  # Propane should be ignored
         assert "Propane" not in gas.components
 
+    def test_multi_word_names_and_invalid_fractions(self):
+        """Test that names with spaces parse and non-numeric fractions are skipped."""
+        gas = GasState("Methane=0.9, Carbon dioxide=0.1, Ethane=abc")
+        assert gas.components == ["Methane", "Carbon dioxide"]
+        assert pytest.approx(sum(gas.molar_fraction), abs=0.001) == 1.0
+
+    def test_from_dict_matches_string(self):
+        """Test that a mapping builds the same state as the equivalent string."""
+        gas = GasState.from_dict({"Methane": 1.8, "Ethane": 0.2, "Propane": 0.0})
+        expected = GasState("Methane=0.9, Ethane=0.1")
+
+        assert gas.components == expected.components
+        assert gas.molar_fraction == pytest.approx(expected.molar_fraction)
+        assert gas.molar_mass == pytest.approx(expected.molar_mass)
+
 
 class TestGasProperties:
     """Tests for gas property calculations."""
@@ -160,6 +175,40 @@ class TestGasProperties:
         assert props1.M < props_mix.M < props2.M
 
 
+class TestPropertyTable:
+    """Tests for tabulated gas properties."""
+
+    def test_table_matches_get_properties(self):
+        """Test that table entries match direct property calculations."""
+        gas = GasState("Methane=0.9, Ethane=0.1")
+        T = 300
+
+        pressures, Zs, ks, Ms = gas.build_property_table(1e5, 5e6, T, n=8)
+
+        assert len(pressures) == len(Zs) == len(ks) == len(Ms) == 8
+        assert pressures[0] == 1e5
+        assert pressures[-1] == 5e6
+        for i in (0, 3, 7):
+            props = gas.get_properties(pressures[i], T)
+            assert Zs[i] == pytest.approx(props.Z)
+            assert ks[i] == pytest.approx(props.k)
+            assert Ms[i] == pytest.approx(props.M)
+
+    def test_batch_matches_get_properties(self):
+        """Test that batched properties match one-at-a-time calculations."""
+        gas = GasState("Methane=0.9, Ethane=0.1")
+        pressures = [101325, 1e6, 5e6]
+
+        batch = gas.get_properties_batch(pressures, 300)
+
+        assert len(batch) == len(pressures)
+        for P, props in zip(pressures, batch, strict=True):
+            single = gas.get_properties(P, 300)
+            assert props.Z == pytest.approx(single.Z)
+            assert props.k == pytest.approx(single.k)
+            assert props.rho == pytest.approx(single.rho)
+
+
 class TestDefaultComponents:
     """Tests for default component handling."""
 
@@ -304,6 +353,19 @@ class TestErrorHandling:
         # Should default to pure methane or handle gracefully
         assert len(gas.components) >= 1
 
+    def test_skips_pairs_without_comma_separator(self):
+        """Test that pairs not separated by commas are skipped, not merged."""
+        # Space or semicolon separators leave no valid pair, so pure methane
+        for composition in ("Methane=0.9 Ethane=0.1", "Methane=0.5;Ethane=0.5"):
+            gas = GasState(composition)
+            assert gas.components == ["Methane"]
+            assert gas.molar_fraction == [1.0]
+
+        # A pair with two fractions is dropped, the valid pair is kept
+        gas = GasState("Methane=0.5=0.5, Ethane=0.5")
+        assert gas.components == ["Ethane"]
+        assert gas.molar_fraction == [1.0]
+
     def test_properties_at_extreme_conditions(self):
         """Test that properties can be calculated at extreme conditions."""
         gas = GasState("Methane=1.0")
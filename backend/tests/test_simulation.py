@@ -4,9 +4,15 @@ This module tests the main simulation engine that integrates
 all physics calculations over time.
 """
 
+import numpy as np
 import pandas as pd
 import pytest
-from pressurize.core.simulation import run_simulation_streaming
+from pressurize.core.simulation import (
+    FLOW_REGIMES,
+    run_simulation_batch,
+    run_simulation_grid,
+    run_simulation_streaming,
+)
 
 
 def run_simulation(*args, **kwargs):
@@ -169,6 +175,34 @@ class TestValveOpeningModes:
         # And remain at 100%
         assert all(df["valve_opening_pct"] == 100.0)
 
+    def test_adaptive_dt_fixed_mode(self):
+        """Test that adaptive time stepping takes fewer steps to the same result."""
+        params = dict(
+            P_up=3500000,
+            P_down_init=100000,
+            upstream_volume=10.0,
+            downstream_volume=20.0,
+            valve_id=0.01,
+            opening_time=5,
+            upstream_temp=300,
+            downstream_temp=300,
+            molar_mass=29,
+            z_factor=1.0,
+            k_ratio=1.4,
+            opening_mode="fixed",
+            mode="pressurize",
+            dt=0.1,
+        )
+
+        df_uniform = run_simulation(**params)
+        df_adaptive = run_simulation(**params, adaptive_dt=True)
+
+        assert len(df_adaptive) < len(df_uniform)
+        assert df_adaptive["downstream_pressure"].iloc[-1] == pytest.approx(
+            df_uniform["downstream_pressure"].iloc[-1], rel=1e-6
+        )
+        assert (df_adaptive["time"].diff().iloc[1:] > 0).all()
+
     def test_exponential_opening_mode(self):
         """Test exponential valve opening mode."""
         opening_time = 10
@@ -545,6 +579,34 @@ class TestCompositionMode:
         assert "k_ratio" in df.columns
         assert "molar_mass" in df.columns
 
+    def test_property_update_stride(self):
+        """Test that updating properties every N steps stays close to every step."""
+        params = dict(
+            P_up=3500000,
+            P_down_init=100000,
+            upstream_volume=1.0,
+            downstream_volume=1.0,
+            valve_id=0.05,
+            opening_time=5,
+            upstream_temp=300,
+            downstream_temp=300,
+            molar_mass=29,
+            z_factor=1.0,
+            k_ratio=1.4,
+            property_mode="composition",
+            composition="Methane=0.9, Ethane=0.1",
+        )
+
+        df_every = run_simulation(**params, property_update_stride=1)
+        df_strided = run_simulation(**params, property_update_stride=10)
+
+        P_every = df_every["downstream_pressure"].iloc[-1]
+        P_strided = df_strided["downstream_pressure"].iloc[-1]
+        assert P_strided == pytest.approx(P_every, rel=0.01)
+
+        with pytest.raises(ValueError):
+            run_simulation(**params, property_update_stride=0)
+
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
@@ -678,6 +740,31 @@ class TestUnitConsistency:
         for i in range(1, len(times)):
             assert times[i] > times[i - 1]
 
+    def test_pressure_offset(self):
+        """Test that pressure_offset shifts reported pressures and nothing else."""
+        params = dict(
+            P_up=3500000,
+            P_down_init=101325,
+            upstream_volume=1.0,
+            downstream_volume=1.0,
+            valve_id=0.05,
+            opening_time=5,
+            upstream_temp=300,
+            downstream_temp=300,
+            molar_mass=29,
+            z_factor=1.0,
+            k_ratio=1.4,
+        )
+
+        df_abs = run_simulation(**params)
+        df_gauge = run_simulation(**params, pressure_offset=101325.0)
+
+        for col in ("pressure", "upstream_pressure", "downstream_pressure"):
+            assert df_gauge[col].to_numpy() == pytest.approx(
+                df_abs[col].to_numpy() - 101325.0
+            )
+        assert df_gauge["flowrate"].equals(df_abs["flowrate"])
+
 
 class TestDualVesselModes:
     """Test suite for dual-vessel modes: pressurize, depressurize, and equalize."""
@@ -856,3 +943,63 @@ class TestDualVesselModes:
         assert all(abs(x) < 1e-6 for x in downstream_dpdt), (
             "Downstream dp/dt should be zero in depressurize mode"
         )
+
+
+class TestSimulationBatch:
+    """Tests for running several simulations in parallel."""
+
+    def test_batch_matches_serial_runs(self):
+        """Test that batch results match individual runs in input order."""
+        base = dict(
+            P_up=3500000,
+            P_down_init=100000,
+            upstream_volume=1.0,
+            downstream_volume=1.0,
+            opening_time=5,
+            upstream_temp=300,
+            downstream_temp=300,
+            molar_mass=29,
+            z_factor=1.0,
+            k_ratio=1.4,
+        )
+        param_dicts = [dict(base, valve_id=d) for d in (0.02, 0.05)]
+
+        results = run_simulation_batch(param_dicts, n_workers=2)
+
+        assert len(results) == 2
+        for params, df in zip(param_dicts, results, strict=True):
+            expected = run_simulation(**params)
+            expected["flow_regime"] = pd.Categorical(
+                expected["flow_regime"], categories=FLOW_REGIMES
+            )
+            pd.testing.assert_frame_equal(df, expected)
+
+    def test_grid_matches_batch_runs(self):
+        """Test that the compiled grid runner matches individual runs."""
+        base = dict(
+            P_down_init=100000,
+            upstream_volume=1.0,
+            downstream_volume=1.0,
+            opening_time=5,
+            upstream_temp=300,
+            downstream_temp=300,
+            molar_mass=29,
+            z_factor=1.0,
+            k_ratio=1.4,
+        )
+        P_ups = [3500000.0, 2000000.0]
+        valve_ids = [0.05, 0.02]
+
+        frames = run_simulation_grid(P_ups, valve_ids, **base)
+        expected = run_simulation_batch(
+            [
+                dict(base, P_up=P_up, valve_id=valve_id)
+                for P_up, valve_id in zip(P_ups, valve_ids, strict=True)
+            ]
+        )
+
+        assert len(frames) == 2
+        for df, df_expected in zip(frames, expected, strict=True):
+            pd.testing.assert_frame_equal(df, df_expected, rtol=1e-6)
+            # Time is stored in float64, so it matches exactly
+            np.testing.assert_array_equal(df["time"], df_expected["time"])
@@ -54,6 +54,32 @@ export async function fetchUnitConfig(): Promise<UnitConfig> {
   }
 }
 
+export interface CompositionOptions {
+  components: string[];
+  presets: { id: string; name: string }[];
+}
+
+// Component and preset lists are static for the server's lifetime, so one
+// request serves every opening of the composition editor.
+let compositionOptions: Promise<CompositionOptions> | null = null;
+
+export function fetchCompositionOptions(): Promise<CompositionOptions> {
+  if (!compositionOptions) {
+    compositionOptions = Promise.all([
+      apiClient.get<string[]>("/components"),
+      apiClient.get<CompositionOptions["presets"]>("/presets"),
+    ]).then(([compsRes, presetsRes]) => ({
+      components: compsRes.data,
+      presets: presetsRes.data,
+    }));
+    // Allow a retry on the next call if the request fails
+    compositionOptions.catch(() => {
+      compositionOptions = null;
+    });
+  }
+  return compositionOptions;
+}
+
 /**
  * Get unit string for a dimension in the current system.
  */